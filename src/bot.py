@@ -4,6 +4,8 @@ import signal
 import sys
 import logging
 import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 # Third-party imports
 from dotenv import load_dotenv
@@ -37,6 +39,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Hand log records to a background listener so handler threads never block on stream writes
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 # Initialize services and bot
 dotenv_path = os.path.join(os.path.dirname(__file__), '.env')
 load_dotenv(dotenv_path)
@@ -62,7 +72,10 @@ register_member_handlers(bot, services.db)
 
 # Register drive handlers with state manager
 event_handlers = register_event_handlers(bot, services.db, services.drive_service, state_manager)
-upload_handlers = register_upload_handlers(bot, services.db, services.drive_service, state_manager)
+upload_handlers = register_upload_handlers(
+    bot, services.db, services.drive_service, state_manager,
+    rclone_provider=lambda: services.rclone_service
+)
 register_drive_handlers(bot, services.db, services.drive_service)
 register_admin_handlers(bot, services.db)
 register_media_copy_handlers(bot, services.db, services.drive_service, state_manager)
@@ -14,6 +14,12 @@ from src.utils.user_actions import log_action, ActionType
 from src.utils.markup_helpers import create_navigation_markup
 from src.utils.pagination import paginate_items
 
+# Approved members, as listed by /listmembers
+MEMBERS_QUERY = {
+    'registration_status': 'approved',
+    'role': Role.MEMBER.name.lower()
+}
+
 def register_member_management_handlers(bot: TeleBot, db: MongoDB):
     
     @bot.message_handler(commands=['listmembers'])
@@ -24,41 +30,37 @@ def register_member_management_handlers(bot: TeleBot, db: MongoDB):
             logging.debug("[listmembers] Starting list_members function")
             logging.debug(f"[listmembers] User ID: {message.from_user.id}")
             
-            members = db.users.find({
-                'registration_status': 'approved',
-                'role': Role.MEMBER.name.lower()
-            })
-            member_list = list(members)
-            logging.debug(f"[listmembers] Found {len(member_list)} members")
+            total_members = db.users.count_documents(MEMBERS_QUERY)
+            logging.debug(f"[listmembers] Found {total_members} members")
             
             log_action(
                 ActionType.ADMIN_COMMAND,
                 message.from_user.id,
                 metadata={
                     'command': 'listmembers',
-                    'members_count': len(member_list)
+                    'members_count': total_members
                 }
             )
             
-            if not member_list:
+            if not total_members:
                 logging.debug("[listmembers] No members found")
                 bot.reply_to(message, "📝 No registered members found.")
                 return
                 
             # Create paginated response
             page_size = 10
-            total_members = len(member_list)
             total_pages = (total_members + page_size - 1) // page_size
             logging.debug(f"[listmembers] Pagination: total_members={total_members}, page_size={page_size}, total_pages={total_pages}")
             
             def create_member_page(page):
                 logging.debug(f"[listmembers] Creating page {page} of {total_pages}")
-                start_idx = (page - 1) * page_size
-                end_idx = min(start_idx + page_size, total_members)
-                logging.debug(f"[listmembers] Page indices: start={start_idx}, end={end_idx}")
+                # Only the requested page is fetched from the database
+                pagination_data = paginate_items(
+                    db.users.find(MEMBERS_QUERY), page, page_size=page_size, total_count=total_members
+                )
                 
                 response = f"👥 *Members List (Page {page}/{total_pages}):*\n\n"
-                for member in member_list[start_idx:end_idx]:
+                for member in pagination_data.current_items:
                     response += (f"• ID: `{member['user_id']}`\n"
                                f"  Username: @{member.get('username', 'N/A')}\n"
                                f"  Name: {member.get('first_name', '')} {member.get('last_name', '')}\n\n")
@@ -96,26 +98,22 @@ def register_member_management_handlers(bot: TeleBot, db: MongoDB):
             page = int(call.data.split('_')[1])
             logging.debug(f"[members_nav] Requested page: {page}")
             
-            members = db.users.find({
-                'registration_status': 'approved',
-                'role': Role.MEMBER.name.lower()
-            })
-            member_list = list(members)
-            logging.debug(f"[members_nav] Found {len(member_list)} members")
+            total_members = db.users.count_documents(MEMBERS_QUERY)
+            logging.debug(f"[members_nav] Found {total_members} members")
             
             page_size = 10
-            total_members = len(member_list)
             total_pages = (total_members + page_size - 1) // page_size
             logging.debug(f"[members_nav] Pagination: total_members={total_members}, page_size={page_size}, total_pages={total_pages}")
             
             def create_member_page(page):
                 logging.debug(f"[members_nav] Creating page {page} of {total_pages}")
-                start_idx = (page - 1) * page_size
-                end_idx = min(start_idx + page_size, total_members)
-                logging.debug(f"[members_nav] Page indices: start={start_idx}, end={end_idx}")
+                # Only the requested page is fetched from the database
+                pagination_data = paginate_items(
+                    db.users.find(MEMBERS_QUERY), page, page_size=page_size, total_count=total_members
+                )
                 
                 response = f"👥 *Members List (Page {page}/{total_pages}):*\n\n"
-                for member in member_list[start_idx:end_idx]:
+                for member in pagination_data.current_items:
                     response += (f"• ID: `{member['user_id']}`\n"
                                f"  Username: @{member.get('username', 'N/A')}\n"
                                f"  Name: {member.get('first_name', '')} {member.get('last_name', '')}\n\n")
@@ -16,6 +16,7 @@ from src.utils.pagination import paginate_items
 from src.utils.markup_helpers import create_navigation_markup
 from src.utils.message_helpers import split_and_send_messages
 from src.utils.drive_formatters import format_drive_items
+from src.utils.file_helpers import format_file_size
 from src.utils.user_actions import log_action, ActionType
 from src.utils.message_helpers import escape_markdown
 
@@ -35,12 +36,12 @@ def register_list_handlers(bot: TeleBot, drive_service: GoogleDriveService, db:
                 return
 
             pagination_data = paginate_items(files, page)
-            response = f"📂 *Team Drive Contents (Page {pagination_data['page']}/{pagination_data['total_pages']}):*\n\n"
-            response += format_drive_items(pagination_data['current_items'])
+            response = f"📂 *Team Drive Contents (Page {pagination_data.page}/{pagination_data.total_pages}):*\n\n"
+            response += format_drive_items(pagination_data.current_items)
 
             markup = create_navigation_markup(
-                pagination_data['page'],
-                pagination_data['total_pages'],
+                pagination_data.page,
+                pagination_data.total_pages,
                 'listteamdrive'
             )
 
@@ -77,9 +78,9 @@ def register_list_handlers(bot: TeleBot, drive_service: GoogleDriveService, db:
                 return
 
             pagination_data = paginate_items(drives, page)
-            response = f"📂 *Drive List (Page {pagination_data['page']}/{pagination_data['total_pages']}):*\n\n"
+            response = f"📂 *Drive List (Page {pagination_data.page}/{pagination_data.total_pages}):*\n\n"
             
-            for drive in pagination_data['current_items']:
+            for drive in pagination_data.current_items:
                 response += (
                     f"• *Name:* {drive['name']}\n"
                     f"  *ID:* `{drive['id']}`\n"
@@ -87,8 +88,8 @@ def register_list_handlers(bot: TeleBot, drive_service: GoogleDriveService, db:
                 )
 
             markup = create_navigation_markup(
-                pagination_data['page'],
-                pagination_data['total_pages'],
+                pagination_data.page,
+                pagination_data.total_pages,
                 'listdrives'
             )
             split_and_send_messages(bot, message, response, markup=markup)
@@ -100,7 +101,7 @@ def register_list_handlers(bot: TeleBot, drive_service: GoogleDriveService, db:
                     'command': 'listdrives',
                     'page': page,
                     'total_drives': len(drives),
-                    'total_pages': pagination_data['total_pages']
+                    'total_pages': pagination_data.total_pages
                 }
             )
 
@@ -133,12 +134,12 @@ def register_list_handlers(bot: TeleBot, drive_service: GoogleDriveService, db:
                 )
 
             pagination_data = paginate_items(items, page)
-            response = f"📂 *{title} (Page {pagination_data['page']}/{pagination_data['total_pages']}):*\n\n"
-            response += format_func(pagination_data['current_items'])
+            response = f"📂 *{title} (Page {pagination_data.page}/{pagination_data.total_pages}):*\n\n"
+            response += format_func(pagination_data.current_items)
 
             markup = create_navigation_markup(
-                pagination_data['page'],
-                pagination_data['total_pages'],
+                pagination_data.page,
+                pagination_data.total_pages,
                 command
             )
 
@@ -226,14 +227,6 @@ def register_list_handlers(bot: TeleBot, drive_service: GoogleDriveService, db:
             )
             total_size = drive_service.get_folder_size(folder_id)
 
-            # Format sizes
-            def format_size(size_bytes):
-                for unit in ['B', 'KB', 'MB', 'GB']:
-                    if size_bytes < 1024:
-                        return f"{size_bytes:.1f} {unit}"
-                    size_bytes /= 1024
-                return f"{size_bytes:.1f} TB"
-
             bot.edit_message_text(
                 "📊 Preparing statistics...\n"
                 f"📁 Folder: {folder_name}",
@@ -269,21 +262,21 @@ def register_list_handlers(bot: TeleBot, drive_service: GoogleDriveService, db:
                     response += (
                         f"• {file_type}: "
                         f"`{stats['count']} files` "
-                        f"\\({escape_markdown(format_size(stats['size']))}\\)\n"
+                        f"\\({escape_markdown(format_file_size(stats['size']))}\\)\n"
                     )
 
                 # Add total stats
                 response += (
                     f"\n*Total Media:* `{media_stats['total_files']} files` "
-                    f"\\({escape_markdown(format_size(media_stats['total_size']))}\\)\n"
-                    f"*Total Folder Size:* `{escape_markdown(format_size(total_size))}`"
+                    f"\\({escape_markdown(format_file_size(media_stats['total_size']))}\\)\n"
+                    f"*Total Folder Size:* `{escape_markdown(format_file_size(total_size))}`"
                 )
 
             else:
                 response = (
                     f"📊 *Folder Statistics*\n\n"
                     f"*Folder:* `{escape_markdown(folder_name)}`\n"
-                    f"*Total Size:* `{escape_markdown(format_size(total_size))}`\n\n"
+                    f"*Total Size:* `{escape_markdown(format_file_size(total_size))}`\n\n"
                     f"❌ Error getting media stats: {escape_markdown(media_stats['error'])}"
                 )
 
@@ -32,7 +32,11 @@ def register_list_events_handlers(bot: TeleBot, db: MongoDB, drive_service: Goog
                 bot.reply_to(message, "❌ Root folder ID is not configured.")
                 return
             
-            items = drive_service.list_files(folder_id=root_folder_id, recursive=False)
+            items = drive_service.list_files(
+                folder_id=root_folder_id,
+                recursive=False,
+                fields='id, name, mimeType, webViewLink, size'
+            )
             if not items:
                 bot.reply_to(message, "📝 No items found in the events folder.")
                 return
@@ -41,12 +45,12 @@ def register_list_events_handlers(bot: TeleBot, db: MongoDB, drive_service: Goog
             sorted_items = sort_items_by_date(items)
             
             pagination_data = paginate_items(sorted_items, page)
-            response = f"📂 *Events Folder Contents (Page {pagination_data['page']}/{pagination_data['total_pages']}):*\n\n"
-            response += format_drive_items(pagination_data['current_items'])
+            response = f"📂 *Events Folder Contents (Page {pagination_data.page}/{pagination_data.total_pages}):*\n\n"
+            response += format_drive_items(pagination_data.current_items)
 
             markup = create_navigation_markup(
-                pagination_data['page'],
-                pagination_data['total_pages'],
+                pagination_data.page,
+                pagination_data.total_pages,
                 'listeventsfolder'
             )
 
@@ -63,18 +67,22 @@ def register_list_events_handlers(bot: TeleBot, db: MongoDB, drive_service: Goog
             page = int(page_str)
             
             root_folder_id = os.getenv('GDRIVE_ROOT_FOLDER_ID')
-            items = drive_service.list_files(folder_id=root_folder_id, recursive=False)
+            items = drive_service.list_files(
+                folder_id=root_folder_id,
+                recursive=False,
+                fields='id, name, mimeType, webViewLink, size'
+            )
             
             # Sort items by date (latest first)
             sorted_items = sort_items_by_date(items)
             
             pagination_data = paginate_items(sorted_items, page)
-            response = f"📂 *Events Folder Contents (Page {pagination_data['page']}/{pagination_data['total_pages']}):*\n\n"
-            response += format_drive_items(pagination_data['current_items'])
+            response = f"📂 *Events Folder Contents (Page {pagination_data.page}/{pagination_data.total_pages}):*\n\n"
+            response += format_drive_items(pagination_data.current_items)
 
             markup = create_navigation_markup(
-                pagination_data['page'],
-                pagination_data['total_pages'],
+                pagination_data.page,
+                pagination_data.total_pages,
                 'listeventsfolder'
             )
 
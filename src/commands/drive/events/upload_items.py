@@ -3,13 +3,17 @@ from telebot import TeleBot
 from telebot.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKeyboardButton
 from src.database.mongo_db import MongoDB
 from src.services.drive_service import GoogleDriveService
+from src.services.rclone.rclone_service import RcloneService
 from src.utils.message_helpers import escape_markdown
 from src.utils.user_actions import log_action, ActionType
-from src.utils.state_management import UserStateManager
+from src.utils.state_management import UserStateManager, PendingUpload
 from src.utils.file_helpers import get_file_info, format_file_size
 from src.utils.file_handler import TempFileHandler
 from telebot.handler_backends import State, StatesGroup
-from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import os
 import time
 import logging
 
@@ -34,17 +38,39 @@ logging.getLogger('telebot').setLevel(logging.WARNING)
 
 CMD_UPLOAD_TO_EVENT = 'upload_to_event'
 
+# A single file below this size goes straight through the Drive API; rclone's startup cost would dominate
+RCLONE_DIRECT_THRESHOLD = int(os.getenv('RCLONE_DIRECT_THRESHOLD', str(4 * 1024 * 1024)))
+
+def _run_coroutine(coro):
+    """
+    Run a coroutine to completion from synchronous handler code
+
+    TeleBot calls handlers on its worker threads, which never have an event loop
+    of their own, so asyncio.run is used directly. If a loop is already running in
+    this thread, the coroutine gets a fresh loop on a helper thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 class UploadStates(StatesGroup):
     selecting_event = State()
     uploading = State()
 
 class UploadManager:
-    def __init__(self, bot: TeleBot, db: MongoDB, drive_service: GoogleDriveService, state_manager: UserStateManager):
+    def __init__(self, bot: TeleBot, db: MongoDB, drive_service: GoogleDriveService, state_manager: UserStateManager,
+                 rclone_provider: Optional[Callable[[], RcloneService]] = None):
         self.bot = bot
         self.db = db
         self.drive_service = drive_service
         self.state_manager = state_manager
         self.temp_handler = TempFileHandler()
+        # Shared, lazily created rclone service (ServiceContainer.rclone_service)
+        self._rclone_provider = rclone_provider or RcloneService
+        self._rclone_service = None
         self.ITEMS_PER_PAGE = 5
         self.register_handlers()
 
@@ -308,44 +334,39 @@ class UploadManager:
 
             # Get file details based on type
             if message.document:
-                file_info = self.bot.get_file(message.document.file_id)
+                file_id = message.document.file_id
+                file_info = self.bot.get_file(file_id)
                 size_bytes = message.document.file_size
                 logger.debug("Processing document")
             elif message.photo:
-                file_info = self.bot.get_file(message.photo[-1].file_id)
+                file_id = message.photo[-1].file_id
+                file_info = self.bot.get_file(file_id)
                 size_bytes = file_info.file_size
                 logger.debug("Processing photo")
             elif message.video:
-                file_info = self.bot.get_file(message.video.file_id)
+                file_id = message.video.file_id
+                file_info = self.bot.get_file(file_id)
                 size_bytes = message.video.file_size
                 logger.debug("Processing video")
             elif message.audio:
-                file_info = self.bot.get_file(message.audio.file_id)
+                file_id = message.audio.file_id
+                file_info = self.bot.get_file(file_id)
                 size_bytes = message.audio.file_size
                 logger.debug("Processing audio")
             else:
                 logger.error("Unsupported file type")
                 raise ValueError("Unsupported file type")
 
-            # Save file to temporary storage
-            logger.debug(f"Saving file to temporary storage: {file_name}")
-            temp_path = self.temp_handler.save_telegram_file(
-                self.bot,
-                file_info,
-                file_name,
-                user_id
-            )
-            logger.info(f"File saved to: {temp_path}")
-
-            # Add to pending uploads
+            # Add to pending uploads; the file is downloaded with the rest of the batch on Done
             logger.debug("Adding file to pending uploads")
-            self.state_manager.add_pending_upload(user_id, {
-                'name': file_name,
-                'size': file_size,
-                'size_bytes': size_bytes,
-                'type': file_type,
-                'path': temp_path
-            })
+            self.state_manager.add_pending_upload(user_id, PendingUpload(
+                name=self._unique_name(file_name, self.state_manager.get_pending_uploads(user_id)),
+                size=file_size,
+                size_bytes=size_bytes,
+                type=file_type,
+                file_info=file_info,
+                file_id=file_id
+            ))
 
             # Update the status message
             user_state = self.state_manager.get_state(user_id)
@@ -383,6 +404,18 @@ class UploadManager:
             error_msg = escape_markdown(str(e))
             self.bot.reply_to(message, f"❌ Error processing file: {error_msg}", parse_mode="MarkdownV2")
 
+    @staticmethod
+    def _unique_name(file_name: str, pending_uploads: List[PendingUpload]) -> str:
+        """Suffix file_name so it doesn't clash with a file already in the batch"""
+        taken = {file.name for file in pending_uploads}
+        if file_name not in taken:
+            return file_name
+        stem, extension = os.path.splitext(file_name)
+        index = 2
+        while f"{stem} ({index}){extension}" in taken:
+            index += 1
+        return f"{stem} ({index}){extension}"
+
     def process_uploads(self, call: CallbackQuery):
         """Process all pending uploads"""
         user_id = call.from_user.id
@@ -403,7 +436,6 @@ class UploadManager:
             folder_id = user_state['folder_id']
             folder_name = user_state['folder_name']
             total_files = len(pending_uploads)
-            uploaded_files = []
 
             # Update status message
             status_text = (
@@ -418,35 +450,27 @@ class UploadManager:
                 parse_mode="MarkdownV2"
             )
 
-            # Upload files
-            for index, file in enumerate(pending_uploads, 1):
-                progress = (index / total_files) * 100
-                progress_bar = "▓" * int(progress/5) + "░" * (20-int(progress/5))
-                
-                status_text = (
-                    "⏳ *Uploading Files*\n\n"
-                    f"{escape_markdown('Progress:')} `\\[{progress_bar}\\]` {escape_markdown(f'{progress:.1f}%')}\n"
-                    f"{escape_markdown(f'File {index}/{total_files}:')} `{escape_markdown(file['name'])}`"
-                )
-                
-                self.bot.edit_message_text(
-                    status_text,
-                    call.message.chat.id,
-                    call.message.message_id,
-                    parse_mode="MarkdownV2"
-                )
-
-                # Upload file
-                with open(file['path'], 'rb') as f:
-                    uploaded_file = self.drive_service.upload_file(
-                        f.read(),
-                        file['name'],
-                        folder_id
-                    )
-                    uploaded_files.append({
-                        **file,
-                        'web_link': uploaded_file['webViewLink']
-                    })
+            # Download all received files from Telegram concurrently
+            logger.debug(f"Downloading {total_files} files to temporary storage")
+            results = _run_coroutine(self.temp_handler.save_telegram_files(
+                self.bot,
+                [(file.file_id, file.name) for file in pending_uploads],
+                user_id
+            ))
+            downloaded, failed = [], []
+            for file, result in zip(pending_uploads, results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Could not download {file.name}: {str(result)}")
+                    failed.append(file)
+                else:
+                    file.path = result
+                    downloaded.append(file)
+            if not downloaded:
+                raise Exception("Could not download any of the files from Telegram")
+
+            # Upload files; anything that didn't make it joins the failed downloads
+            uploaded_files, not_uploaded = self._upload_files(call, downloaded, folder_id, user_id)
+            failed.extend(not_uploaded)
 
             # Show completion message
             total_size = sum(f['size_bytes'] for f in uploaded_files)
@@ -491,6 +515,11 @@ class UploadManager:
                 f"\n*Total Uploaded:* `{len(uploaded_files)} files` \\({escape_markdown(format_file_size(total_size))}\\)\n"
                 f"*Folder Size:* `{escape_markdown(format_file_size(folder_size))}`"
             )
+            if failed:
+                summary += (
+                    f"\n\n⚠️ *Failed to upload:* `{len(failed)} files`\n"
+                    + "\n".join(f"• `{escape_markdown(file.name)}`" for file in failed)
+                )
 
             self.bot.edit_message_text(
                 summary,
@@ -507,6 +536,7 @@ class UploadManager:
                 metadata={
                     'folder_name': folder_name,
                     'file_count': len(uploaded_files),
+                    'failed_count': len(failed),
                     'total_size': sum(f['size_bytes'] for f in uploaded_files)
                 }
             )
@@ -529,10 +559,105 @@ class UploadManager:
                 user_id,
                 error_message=str(e)
             )
+            self.temp_handler.cleanup_session(user_id)
+            self.state_manager.clear_state(user_id)
 
-def register_upload_handlers(bot: TeleBot, db: MongoDB, drive_service: GoogleDriveService, state_manager: UserStateManager):
+    def _get_rclone_service(self):
+        """Rclone service for bulk uploads, or None when rclone isn't available"""
+        if self._rclone_service is None:
+            try:
+                self._rclone_service = self._rclone_provider()
+            except Exception as e:
+                logger.warning(f"Rclone unavailable, uploading through the Drive API: {str(e)}")
+                self._rclone_service = False
+        return self._rclone_service or None
+
+    def _upload_files(self, call: CallbackQuery, pending_uploads: List[PendingUpload], folder_id: str,
+                      user_id: int) -> Tuple[List[Dict], List[PendingUpload]]:
+        """
+        Upload downloaded files, picking the transfer path by file count and size
+        Returns:
+            Tuple[List[Dict], List[PendingUpload]]: Uploaded files and the files that failed
+        """
+        if len(pending_uploads) == 1 and pending_uploads[0].size_bytes < RCLONE_DIRECT_THRESHOLD:
+            return self._upload_via_api(call, pending_uploads, folder_id)
+
+        rclone_service = self._get_rclone_service()
+        if rclone_service is None:
+            return self._upload_via_api(call, pending_uploads, folder_id)
+        return self._upload_via_rclone(call, rclone_service, pending_uploads, folder_id, user_id)
+
+    def _upload_via_api(self, call: CallbackQuery, pending_uploads: List[PendingUpload],
+                        folder_id: str) -> Tuple[List[Dict], List[PendingUpload]]:
+        """Upload files one by one through the Drive API, showing per-file progress"""
+        total_files = len(pending_uploads)
+        uploaded_files = []
+        for index, file in enumerate(pending_uploads, 1):
+            progress = (index / total_files) * 100
+            progress_bar = "▓" * int(progress/5) + "░" * (20-int(progress/5))
+            
+            status_text = (
+                "⏳ *Uploading Files*\n\n"
+                f"{escape_markdown('Progress:')} `\\[{progress_bar}\\]` {escape_markdown(f'{progress:.1f}%')}\n"
+                f"{escape_markdown(f'File {index}/{total_files}:')} `{escape_markdown(file.name)}`"
+            )
+            
+            self.bot.edit_message_text(
+                status_text,
+                call.message.chat.id,
+                call.message.message_id,
+                parse_mode="MarkdownV2"
+            )
+
+            # Upload file
+            uploaded_file = self.drive_service.upload_file(
+                file.path,
+                file.name,
+                folder_id
+            )
+            uploaded_files.append({
+                **file.as_dict(),
+                'web_link': uploaded_file['webViewLink']
+            })
+            self.state_manager.mark_upload_completed(call.from_user.id, file)
+
+        return uploaded_files, []
+
+    def _upload_via_rclone(self, call: CallbackQuery, rclone_service: RcloneService,
+                           pending_uploads: List[PendingUpload], folder_id: str,
+                           user_id: int) -> Tuple[List[Dict], List[PendingUpload]]:
+        """Move this batch's downloaded files to the folder in one parallel rclone transfer"""
+        self.bot.edit_message_text(
+            "⏳ *Uploading Files*\n\n"
+            f"{escape_markdown(f'Transferring {len(pending_uploads)} files')}\\.\\.\\.",
+            call.message.chat.id,
+            call.message.message_id,
+            parse_mode="MarkdownV2"
+        )
+
+        # The upload's verification listing returns the links for every moved file
+        files_info = _run_coroutine(rclone_service.upload_to_folder(
+            self.temp_handler.get_user_temp_dir(user_id),
+            "",
+            root_folder_id=folder_id,
+            file_names=[file.name for file in pending_uploads]
+        ))
+        uploaded_files, failed = [], []
+        for file in pending_uploads:
+            info = files_info.get(file.name, {})
+            # Files rclone couldn't verify on Drive are reported, not marked completed
+            if not info.get('id'):
+                failed.append(file)
+                continue
+            uploaded_files.append({**file.as_dict(), 'web_link': info['webViewLink']})
+            self.state_manager.mark_upload_completed(user_id, file)
+        return uploaded_files, failed
+
+
+def register_upload_handlers(bot: TeleBot, db: MongoDB, drive_service: GoogleDriveService, state_manager: UserStateManager,
+                             rclone_provider: Optional[Callable[[], RcloneService]] = None):
     """Register upload handlers"""
-    upload_manager = UploadManager(bot, db, drive_service, state_manager)
+    upload_manager = UploadManager(bot, db, drive_service, state_manager, rclone_provider)
     return {
         'handle_file_upload': upload_manager.handle_file_upload,
         'handle_upload_action': upload_manager.handle_upload_action,
@@ -4,6 +4,7 @@ from telebot.types import Message, CallbackQuery, InlineKeyboardMarkup, InlineKe
 from src.database.mongo_db import MongoDB
 from src.services.drive_service import GoogleDriveService
 from src.utils.state_management import UserStateManager
+from src.utils.file_helpers import format_file_size
 from src.commands.constants import CMD_COPYMEDIA
 import re
 import logging
@@ -255,53 +256,15 @@ def register_media_copy_handlers(bot: TeleBot, db: MongoDB, drive_service: Googl
                 
             logger.debug(f"Retrieved target folder ID: {target_folder_id}")
             
-            # Get folder statistics
-            status_message = bot.reply_to(message, "🔍 Analyzing folder contents...")
-            
-            folder_stats = drive_service.get_folder_stats(source_folder_id)
-            if not folder_stats.get('success'):
-                error_msg = folder_stats.get('error', 'Unknown error')
-                logger.error(f"Failed to get folder stats: {error_msg}")
-                bot.edit_message_text(
-                    f"❌ Error analyzing folder: {error_msg}",
-                    status_message.chat.id,
-                    status_message.message_id
-                )
-                return
-                
-            total_files = folder_stats['total_files']
-            total_size = folder_stats['total_size']
-            
-            # Format size for display
-            size_str = ""
-            if total_size < 1024:
-                size_str = f"{total_size} B"
-            elif total_size < 1024 * 1024:
-                size_str = f"{total_size/1024:.1f} KB"
-            elif total_size < 1024 * 1024 * 1024:
-                size_str = f"{total_size/(1024*1024):.1f} MB"
-            else:
-                size_str = f"{total_size/(1024*1024*1024):.1f} GB"
-            
-            if total_files == 0:
-                bot.edit_message_text(
-                    "❌ No media files found in the source folder.",
-                    status_message.chat.id,
-                    status_message.message_id
-                )
-                return
-                
             # Create markup with cancel button
             markup = InlineKeyboardMarkup()
             markup.add(InlineKeyboardButton("❌ Cancel", callback_data="copy_cancel"))
-            
-            # Update message with folder stats
-            bot.edit_message_text(
-                f"📊 Found {total_files} media files (Total size: {size_str})\n\n"
+
+            # No prescan: files are counted as the copy walks the source folder
+            status_message = bot.reply_to(
+                message,
                 "🔄 Starting copy process...\n"
                 "⬜️ Progress: 0%",
-                status_message.chat.id,
-                status_message.message_id,
                 reply_markup=markup
             )
             
@@ -313,7 +276,7 @@ def register_media_copy_handlers(bot: TeleBot, db: MongoDB, drive_service: Googl
                     
                 progress_bar = "▓" * int(progress/5) + "░" * (20 - int(progress/5))
                 bot.edit_message_text(
-                    f"📊 Copying {total_files} media files (Total size: {size_str})\n\n"
+                    f"📊 Copying media files ({total_files} found so far)\n\n"
                     f"🔄 Progress: {progress:.1f}%\n"
                     f"[{progress_bar}] {copied_files}/{total_files} files",
                     status_message.chat.id,
@@ -333,7 +296,7 @@ def register_media_copy_handlers(bot: TeleBot, db: MongoDB, drive_service: Googl
                 logger.info(f"Successfully copied {result.get('copied_files')} files")
                 bot.edit_message_text(
                     f"✅ Successfully copied {result.get('copied_files', 0)} media files to the event folder.\n"
-                    f"📊 Total size: {size_str}",
+                    f"📊 Total size: {format_file_size(result.get('total_size', 0))}",
                     status_message.chat.id,
                     status_message.message_id
                 )
@@ -341,7 +304,13 @@ def register_media_copy_handlers(bot: TeleBot, db: MongoDB, drive_service: Googl
                 error_msg = result.get('error', 'Unknown error')
                 logger.error(f"Failed to copy files: {error_msg}")
                 
-                if error_msg == 'Process cancelled by user':
+                if error_msg == 'No media files found in the source folder':
+                    bot.edit_message_text(
+                        "❌ No media files found in the source folder.",
+                        status_message.chat.id,
+                        status_message.message_id
+                    )
+                elif error_msg == 'Process cancelled by user':
                     bot.edit_message_text(
                         "❌ Media copy process cancelled and cleaned up.",
                         status_message.chat.id,
@@ -1,5 +1,6 @@
 import os
 import pymongo
+from pymongo import IndexModel
 from datetime import datetime, UTC
 from typing import Optional, List, Dict
 import threading
@@ -9,6 +10,9 @@ from bson.objectid import ObjectId
 class MongoDB:
     _instance = None
     _local = threading.local()
+    # One-time index migrations already applied in this process
+    _migrated = False
+    _migrate_lock = threading.Lock()
 
     def __init__(self):
         """Initialize MongoDB connection"""
@@ -66,18 +70,50 @@ class MongoDB:
 
     def init_db(self):
         """Initialize database collections and indexes"""
+        # One createIndexes command per collection instead of one per index
         # Create indexes for users collection
-        self.users.create_index('user_id', unique=True)
-        self.users.create_index('username')
-        self.users.create_index('email')
+        self.users.create_indexes([
+            IndexModel('user_id', unique=True),
+            IndexModel('username'),
+            IndexModel('email')
+        ])
 
         # Create indexes for registration_requests collection
-        self.registration_requests.create_index('user_id')
-        self.registration_requests.create_index('status')
+        self.registration_requests.create_indexes([
+            IndexModel('user_id'),
+            # Serves pending lookups: status-only queries use the prefix, per-user checks use both fields
+            IndexModel([
+                ('status', pymongo.ASCENDING),
+                ('user_id', pymongo.ASCENDING)
+            ])
+        ])
 
         # Create indexes for user_actions collection
-        self.user_actions.create_index('user_id')
-        self.user_actions.create_index('timestamp')
+        self.user_actions.create_indexes([
+            IndexModel('user_id'),
+            IndexModel('timestamp'),
+            # Serves get_user_actions: equality fields first, then the sort/range field (ESR order).
+            # Keep new filters in that order so queries stay on the index.
+            IndexModel([
+                ('user_id', pymongo.ASCENDING),
+                ('action_type', pymongo.ASCENDING),
+                ('timestamp', pymongo.DESCENDING)
+            ])
+        ])
+
+        self._migrate_indexes()
+
+    def _migrate_indexes(self):
+        """Drop indexes superseded by newer ones; runs once per process"""
+        if MongoDB._migrated:
+            return
+        with MongoDB._migrate_lock:
+            if MongoDB._migrated:
+                return
+            # The (status, user_id) index replaced the single-field status index
+            if 'status_1' in self.registration_requests.index_information():
+                self.registration_requests.drop_index('status_1')
+            MongoDB._migrated = True
 
     def init_admin(self):
         """Initialize owner user with complete details"""
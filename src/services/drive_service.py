@@ -1,18 +1,31 @@
 # Standard library imports
 import os
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Iterator, Union, BinaryIO
 from enum import Enum
 from pathlib import Path
-import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import logging
+import socket
+import threading
+import time
 
 # Third-party imports
+import httplib2
+import httpx
+import orjson
+from cachetools import TTLCache
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaIoBaseUpload
+from googleapiclient.http import MediaIoBaseUpload, MediaFileUpload
+from googleapiclient.model import JsonModel
 from dotenv import load_dotenv
 
+# Local application imports
+from src.utils.rate_limit import TokenBucket
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -23,6 +36,65 @@ logging.getLogger('pymongo.topology').setLevel(logging.WARNING)
 logging.getLogger('googleapiclient.discovery_cache').setLevel(logging.WARNING)
 logging.getLogger('googleapiclient.discovery').setLevel(logging.WARNING)
 
+# Service-account credentials are parsed once per process and shared
+_CREDENTIALS = None
+_CREDENTIALS_LOCK = threading.Lock()
+
+def _load_credentials(credentials_path: str, scopes: List[str]) -> service_account.Credentials:
+    """Return the cached service-account credentials, reading the key file on first use"""
+    global _CREDENTIALS
+    with _CREDENTIALS_LOCK:
+        if _CREDENTIALS is None:
+            _CREDENTIALS = service_account.Credentials.from_service_account_file(
+                credentials_path, scopes=scopes
+            )
+        return _CREDENTIALS
+
+class _HttpxHttp:
+    """
+    httplib2-compatible transport backed by a shared httpx client.
+    The client speaks HTTP/2 and is thread-safe, so every Drive call multiplexes over
+    one pooled connection instead of a serial HTTP/1.1 socket per httplib2.Http.
+    """
+
+    def __init__(self, client: httpx.Client):
+        self._client = client
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=None,
+                connection_type=None, **kwargs):
+        try:
+            response = self._client.request(method, uri, content=body, headers=headers)
+        except httpx.TimeoutException as e:
+            # Raised as the socket errors googleapiclient already retries on
+            raise socket.timeout(str(e))
+        except httpx.TransportError as e:
+            raise ConnectionError(str(e))
+
+        info = dict(response.headers.items())
+        # httpx has already decoded the body, mirror httplib2 which drops this header too
+        if 'content-encoding' in info:
+            info['-content-encoding'] = info.pop('content-encoding')
+        info['status'] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason_phrase
+        return resp, response.content
+
+    def close(self):
+        self._client.close()
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson instead of the stdlib json module"""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Match JsonModel, which hands back non-JSON bodies unchanged
+            body = content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
 class DriveAccessLevel(Enum):
     NO_ACCESS = "no_access"
     READER = "reader"
@@ -31,37 +103,113 @@ class DriveAccessLevel(Enum):
     ORGANIZER = "organizer"
     OWNER = "owner"
 
+class DriveBatch:
+    """Queue of Drive requests flushed through the batch endpoint, at most 100 per call"""
+    MAX_BATCH_SIZE = 100
+
+    def __init__(self, service):
+        self._service = service
+        self._batch = None
+        self._size = 0
+
+    def add(self, request, callback=None):
+        """Queue a request; callback receives (request_id, response, exception)"""
+        if self._batch is None:
+            self._batch = self._service.new_batch_http_request()
+        self._batch.add(request, callback=callback)
+        self._size += 1
+        if self._size >= self.MAX_BATCH_SIZE:
+            self.execute()
+
+    def execute(self):
+        """Send all queued requests"""
+        if self._batch is not None:
+            self._batch.execute()
+        self._batch = None
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.execute()
+
 class GoogleDriveService:
     _instance = None
     _rclone_service = None
+    _lock = threading.Lock()
+
+    # Retries for rate-limited responses in _execute
+    RATE_LIMIT_RETRIES = 5
+    # 403 error reasons that mean "slow down" rather than "forbidden"
+    _RATE_LIMIT_REASONS = frozenset(['rateLimitExceeded', 'userRateLimitExceeded'])
+    # googleapiclient retries (5xx, connection errors) for idempotent reads
+    READ_RETRIES = 5
+
+    # Uploads below this size use a single multipart request
+    RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+    # Drive query templates, filled with str.format
+    _FOLDERS_Q_TPL = "'{}' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false"
+    _CHILDREN_Q_TPL = "'{}' in parents and trashed=false"
+    _FOLDER_BY_NAME_Q_TPL = (
+        "name='{}' and mimeType='application/vnd.google-apps.folder' and trashed=false and '{}' in parents"
+    )
+
+    # Media MIME types picked up by get_folder_stats and copy_media_files
+    MEDIA_MIME_TYPES = frozenset([
+        'image/jpeg', 'image/png', 'image/gif', 'image/webp',
+        'video/mp4', 'video/quicktime', 'video/x-msvideo',
+        'audio/mpeg', 'audio/mp4', 'audio/wav'
+    ])
 
     def __new__(cls, rclone_service=None):
         if cls._instance is None:
-            cls._instance = super(GoogleDriveService, cls).__new__(cls)
-            cls._instance._initialized = False
-            cls._rclone_service = rclone_service
+            with cls._lock:
+                if cls._instance is None:
+                    instance = super(GoogleDriveService, cls).__new__(cls)
+                    instance._initialized = False
+                    cls._rclone_service = rclone_service
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self, rclone_service=None):
         if self._initialized:
             return
-            
-        # Load environment variables from .env file
-        env_path = Path(__file__).parent.parent.parent / '.env'
-        load_dotenv(env_path)
+        with self._lock:
+            if self._initialized:
+                return
+            self._initialize(rclone_service)
+
+    def _initialize(self, rclone_service=None):
+        """One-time setup of the singleton, run under the class lock"""
+        # Load environment variables from .env file only if the process doesn't already have them
+        if not os.getenv('GDRIVE_TEAM_DRIVE_ID'):
+            env_path = Path(__file__).parent.parent.parent / '.env'
+            load_dotenv(env_path)
         
         self.SCOPES = ['https://www.googleapis.com/auth/drive']  # Full access needed for Team Drive
         self.credentials = None
         self.service = None
         self.rclone_service = self._rclone_service or rclone_service
+
+        # Short-lived caches for repeat lookups; TTLCache is not thread-safe on its own
+        self._cache_lock = threading.Lock()
+        self._exists_cache = TTLCache(maxsize=4096, ttl=60)
+        self._details_cache = TTLCache(maxsize=4096, ttl=30)
+        self._access_cache = TTLCache(maxsize=1, ttl=300)
         
         # Get and validate environment variables
         self.team_drive_id = os.getenv('GDRIVE_TEAM_DRIVE_ID')
         self.root_folder_id = os.getenv('GDRIVE_ROOT_FOLDER_ID')
+
+        # Shape mutating calls below Drive's ~10 writes/sec/user limit
+        write_rps = float(os.getenv('GDRIVE_WRITE_RPS', '9'))
+        self._write_bucket = TokenBucket(rate=write_rps, capacity=max(1, int(write_rps)))
         
-        # Debug prints
-        print(f"Team Drive ID: {self.team_drive_id}")
-        print(f"Root Folder ID: {self.root_folder_id}")
+        logger.debug(f"Team Drive ID: {self.team_drive_id}")
+        logger.debug(f"Root Folder ID: {self.root_folder_id}")
         
         # Validate required environment variables
         if not self.team_drive_id:
@@ -82,21 +230,77 @@ class GoogleDriveService:
                 '../credentials/service-account-key.json'
             )
             
-            if not os.path.exists(credentials_path):
+            if _CREDENTIALS is None and not os.path.exists(credentials_path):
                 raise Exception("Service account credentials file not found")
 
-            self.credentials = service_account.Credentials.from_service_account_file(
-                credentials_path, scopes=self.SCOPES
+            self.credentials = _load_credentials(credentials_path, self.SCOPES)
+            self.http = AuthorizedHttp(self.credentials, http=_HttpxHttp(self._build_http_client()))
+            # Use the discovery document bundled with googleapiclient; no network fetch
+            self.service = build(
+                'drive', 'v3',
+                http=self.http,
+                model=_OrjsonModel(data_wrapper=False),
+                static_discovery=True,
+                cache_discovery=False
             )
-            self.service = build('drive', 'v3', credentials=self.credentials)
         except Exception as e:
             raise Exception(f"Failed to initialize Google Drive service: {str(e)}")
 
+    def _build_http_client(self) -> httpx.Client:
+        """Create the pooled HTTP/2 client shared by every Drive call"""
+        timeout = float(os.getenv('GDRIVE_HTTP_TIMEOUT', '30'))
+        max_connections = int(os.getenv('GDRIVE_HTTP_MAX_CONNECTIONS', '50'))
+        return httpx.Client(
+            http2=True,
+            # Drive API responses never redirect; fail fast instead of following
+            follow_redirects=False,
+            timeout=httpx.Timeout(timeout, connect=10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=min(20, max_connections),
+                max_connections=max_connections,
+                keepalive_expiry=60
+            )
+        )
+
+    @classmethod
+    def _is_rate_limited(cls, error: HttpError) -> bool:
+        """Drive signals throttling as 429, or as 403 with a rate-limit reason"""
+        if error.resp.status == 429:
+            return True
+        if error.resp.status != 403:
+            return False
+        try:
+            errors = orjson.loads(error.content).get('error', {}).get('errors', [])
+        except (orjson.JSONDecodeError, AttributeError, TypeError):
+            return False
+        return any(item.get('reason') in cls._RATE_LIMIT_REASONS for item in errors)
+
+    def _execute(self, request, num_retries: int = 0):
+        """Execute a request, backing off exponentially when rate limited and honouring Retry-After"""
+        delay = 1
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            try:
+                return request.execute(num_retries=num_retries)
+            except HttpError as e:
+                if not self._is_rate_limited(e) or attempt == self.RATE_LIMIT_RETRIES:
+                    raise
+                retry_after = e.resp.get('retry-after', '')
+                wait_time = int(retry_after) if retry_after.isdigit() else delay
+                logger.warning(f"Drive rate limit hit, retrying in {wait_time}s")
+                time.sleep(wait_time)
+                delay *= 2
+
     def verify_drive_access(self) -> Tuple[bool, Dict[str, Dict]]:
         """
         Verify access levels for Team Drive and root folder
         Returns: Tuple of (success_status, {resource: {access_level, name, url}})
+        Successful results are cached for 5 minutes.
         """
+        with self._cache_lock:
+            cached = self._access_cache.get('access')
+        if cached is not None:
+            return cached
+
         try:
             access_info = {}
             
@@ -104,7 +308,7 @@ class GoogleDriveService:
             drive_response = self.service.drives().get(
                 driveId=self.team_drive_id,
                 fields='id, name, capabilities'
-            ).execute()
+            ).execute(num_retries=self.READ_RETRIES)
             
             capabilities = drive_response.get('capabilities', {})
             
@@ -132,7 +336,7 @@ class GoogleDriveService:
                 fileId=self.root_folder_id,
                 supportsAllDrives=True,
                 fields='id, name, capabilities, webViewLink'
-            ).execute()
+            ).execute(num_retries=self.READ_RETRIES)
             
             folder_capabilities = folder_response.get('capabilities', {})
             
@@ -157,6 +361,8 @@ class GoogleDriveService:
                        f"https://drive.google.com/drive/u/0/folders/{self.root_folder_id}")
             }
 
+            with self._cache_lock:
+                self._access_cache['access'] = (True, access_info)
             return True, access_info
 
         except HttpError as e:
@@ -169,146 +375,222 @@ class GoogleDriveService:
         except Exception as e:
             return False, {"error": str(e)}
 
-    def list_folders(self, parent_folder_id: Optional[str] = None) -> List[Dict]:
-        """List all folders in the specified parent folder within Team Drive"""
-        try:
-            folder_id = parent_folder_id or self.root_folder_id
-            if not folder_id:
-                raise Exception("No folder ID provided and no root folder ID set")
-
-            query = [
-                f"'{folder_id}' in parents",
-                "mimeType='application/vnd.google-apps.folder'",
-                "trashed=false"
-            ]
+    def _list_all_pages(self, fields: str, **params) -> List[Dict]:
+        """Run a files().list query and collect every page of results"""
+        files = []
+        page_token = None
+
+        while True:
+            request = self.service.files().list(
+                pageSize=1000,
+                pageToken=page_token,
+                fields=f'nextPageToken, files({fields})',
+                **params
+            )
+            results = self._execute(request, num_retries=self.READ_RETRIES)
+            files.extend(results.get('files', []))
 
-            results = self.service.files().list(
-                q=" and ".join(query),
-                supportsAllDrives=True,
-                includeItemsFromAllDrives=True,
-                corpora='drive',
-                driveId=self.team_drive_id,
-                fields='files(id, name, createdTime, modifiedTime)',
-                orderBy='name'
-            ).execute()
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
 
-            return results.get('files', [])
+        return files
 
-        except Exception as e:
-            raise Exception(f"Failed to list folders: {str(e)}")
+    def list_folders(self, parent_folder_id: Optional[str] = None,
+                     fields: str = 'id, name, createdTime, modifiedTime') -> List[Dict]:
+        """
+        List all folders in the specified parent folder within Team Drive
+        Args:
+            parent_folder_id: ID of the parent folder (defaults to root folder)
+            fields: Comma-separated file fields to return for each folder
+        """
+        folder_id = parent_folder_id or self.root_folder_id
+        if not folder_id:
+            raise ValueError("No folder ID provided and no root folder ID set")
+
+        return self._list_all_pages(
+            fields,
+            q=self._FOLDERS_Q_TPL.format(folder_id),
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True,
+            corpora='drive',
+            driveId=self.team_drive_id,
+            orderBy='name'
+        )
 
     def get_folder_details(self, folder_id: str) -> Dict:
         """Get details of a specific folder in Team Drive"""
-        try:
-            return self.service.files().get(
-                fileId=folder_id,
-                supportsAllDrives=True,
-                fields='id, name, createdTime, modifiedTime, parents',
-            ).execute()
-        except Exception as e:
-            raise Exception(f"Failed to get folder details: {str(e)}")
+        with self._cache_lock:
+            cached = self._details_cache.get(folder_id)
+        if cached is not None:
+            return cached
+
+        details = self.service.files().get(
+            fileId=folder_id,
+            supportsAllDrives=True,
+            fields='id, name, createdTime, modifiedTime, parents',
+        ).execute(num_retries=self.READ_RETRIES)
+        with self._cache_lock:
+            self._details_cache[folder_id] = details
+        return details
 
     def create_folder(self, name: str, parent_id: Optional[str] = None) -> Dict:
         """Create a new folder in Team Drive"""
-        try:
-            file_metadata = {
-                'name': name,
-                'mimeType': 'application/vnd.google-apps.folder',
-                'parents': [parent_id or self.root_folder_id],
-                'driveId': self.team_drive_id
-            }
-
-            folder = self.service.files().create(
+        file_metadata = {
+            'name': name,
+            'mimeType': 'application/vnd.google-apps.folder',
+            'parents': [parent_id or self.root_folder_id],
+            'driveId': self.team_drive_id
+        }
+
+        self._write_bucket.acquire()
+        folder = self.service.files().create(
+            body=file_metadata,
+            supportsAllDrives=True,
+            fields='id, name, createdTime, modifiedTime, webViewLink'
+        ).execute()
+
+        with self._cache_lock:
+            self._exists_cache.pop((name, parent_id or self.root_folder_id), None)
+
+        return folder
+
+    def new_batch(self) -> DriveBatch:
+        """Start a batch of Drive mutations (media uploads cannot be batched)"""
+        return DriveBatch(self.service)
+
+    def create_folder_batched(self, batch: DriveBatch, name: str, parent_id: Optional[str] = None,
+                              callback=None) -> None:
+        """Queue a folder creation on a batch created by new_batch()"""
+        file_metadata = {
+            'name': name,
+            'mimeType': 'application/vnd.google-apps.folder',
+            'parents': [parent_id or self.root_folder_id],
+            'driveId': self.team_drive_id
+        }
+        cache_key = (name, parent_id or self.root_folder_id)
+
+        def on_created(request_id, response, exception):
+            # Update the cache only once the batch has actually run, so a
+            # folder_exists call in between can't leave a stale False behind
+            if exception is None:
+                with self._cache_lock:
+                    self._exists_cache[cache_key] = True
+            if callback:
+                callback(request_id, response, exception)
+
+        self._write_bucket.acquire()
+        batch.add(
+            self.service.files().create(
                 body=file_metadata,
                 supportsAllDrives=True,
                 fields='id, name, createdTime, modifiedTime, webViewLink'
-            ).execute()
-
-            return folder
-        except Exception as e:
-            raise Exception(f"Failed to create folder: {str(e)}")
-
-    def list_files(self, folder_id: Optional[str] = None, recursive: bool = False) -> List[Dict]:
+            ),
+            callback=on_created
+        )
+
+    def set_folder_sharing_permissions_batched(self, batch: DriveBatch, folder_id: str, callback=None) -> None:
+        """Queue an 'anyone with the link can add content' permission on a batch"""
+        self._write_bucket.acquire()
+        batch.add(
+            self.service.permissions().create(
+                fileId=folder_id,
+                body={
+                    'type': 'anyone',
+                    'role': 'writer',
+                    'allowFileDiscovery': False
+                },
+                supportsAllDrives=True,
+                sendNotificationEmail=False
+            ),
+            callback=callback
+        )
+
+    def _list_one(self, folder_id: str, fields: str = 'id, name, mimeType') -> List[Dict]:
+        """List the direct children of a single folder"""
+        return self._list_all_pages(
+            fields,
+            q=self._CHILDREN_Q_TPL.format(folder_id),
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True,
+            corpora='drive',
+            driveId=self.team_drive_id,
+            orderBy='name'
+        )
+
+    def list_files(self, folder_id: Optional[str] = None, recursive: bool = False,
+                   fields: str = 'id, name, mimeType') -> List[Dict]:
         """
         List all files and folders in the specified folder
         Args:
             folder_id: ID of the folder to list contents from (defaults to root folder)
             recursive: Whether to list contents of subfolders recursively
+            fields: Comma-separated file fields to return, e.g. add 'webViewLink, size' for display
         """
-        try:
-            current_folder_id = folder_id or self.root_folder_id
-            
-            # Double check folder ID is available
-            if not current_folder_id:
-                raise ValueError("No folder ID provided and root folder ID not set")
+        current_folder_id = folder_id or self.root_folder_id
 
-            # Verify folder exists and is accessible
-            try:
-                self.service.files().get(
-                    fileId=current_folder_id,
-                    supportsAllDrives=True
-                ).execute()
-            except Exception as e:
-                raise ValueError(f"Invalid or inaccessible folder ID: {current_folder_id}")
+        # Double check folder ID is available
+        if not current_folder_id:
+            raise ValueError("No folder ID provided and root folder ID not set")
 
-            query = [
-                f"'{current_folder_id}' in parents",
-                "trashed=false"
-            ]
+        # Recursion needs mimeType to tell folders apart
+        if recursive and 'mimeType' not in fields:
+            fields = f'{fields}, mimeType'
 
-            results = self.service.files().list(
-                q=" and ".join(query),
-                supportsAllDrives=True,
-                includeItemsFromAllDrives=True,
-                corpora='drive',
-                driveId=self.team_drive_id,
-                fields='files(id, name, mimeType, createdTime, modifiedTime, webViewLink, size)',
-                orderBy='name'
-            ).execute()
-
-            files = results.get('files', [])
-
-            if recursive:
-                for file in files:
-                    if file['mimeType'] == 'application/vnd.google-apps.folder':
-                        subfiles = self.list_files(file['id'], recursive=True)
-                        file['children'] = subfiles
-
-            return files
-
-        except Exception as e:
-            raise Exception(f"Failed to list files: {str(e)}")
+        # The list call itself reports a missing or inaccessible folder
+        try:
+            files = self._list_one(current_folder_id, fields)
+        except HttpError as e:
+            if e.resp.status in (403, 404):
+                raise ValueError(f"Invalid or inaccessible folder ID: {current_folder_id}")
+            raise
+
+        if recursive:
+            # Breadth-first: fetch every folder of one level concurrently
+            level = [file for file in files if file['mimeType'] == 'application/vnd.google-apps.folder']
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                while level:
+                    futures = {
+                        executor.submit(self._list_one, folder['id'], fields): folder
+                        for folder in level
+                    }
+                    level = []
+                    for future in as_completed(futures):
+                        children = future.result()
+                        futures[future]['children'] = children
+                        level.extend(
+                            child for child in children
+                            if child['mimeType'] == 'application/vnd.google-apps.folder'
+                        )
+
+        return files
 
     def list_drives(self) -> List[Dict]:
         """
         List all shared drives accessible to the service account
         Returns: List of drives with basic information
         """
-        try:
-            drives = []
-            page_token = None
-            
-            while True:
-                response = self.service.drives().list(
-                    pageSize=100,
-                    pageToken=page_token,
-                    fields="nextPageToken, drives(id, name, kind)"
-                ).execute()
-                
-                drives.extend(response.get('drives', []))
-                
-                page_token = response.get('nextPageToken')
-                if not page_token:
-                    break
-                    
-            return [{
-                'id': drive['id'],
-                'name': drive['name'],
-                'type': drive['kind']
-            } for drive in drives]
-            
-        except Exception as e:
-            raise Exception(f"Failed to list drives: {str(e)}")
+        drives = []
+        page_token = None
+
+        while True:
+            response = self.service.drives().list(
+                pageSize=100,
+                pageToken=page_token,
+                fields="nextPageToken, drives(id, name, kind)"
+            ).execute(num_retries=self.READ_RETRIES)
+
+            drives.extend(response.get('drives', []))
+
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+
+        return [{
+            'id': drive['id'],
+            'name': drive['name'],
+            'type': drive['kind']
+        } for drive in drives]
 
     def list_team_drive_contents(self) -> List[Dict]:
         """
@@ -317,28 +599,16 @@ class GoogleDriveService:
         Returns:
             List[Dict]: List of file/folder metadata dictionaries with name and webViewLink
         """
-        try:
-            # Query to get only root-level files and folders in the Team Drive
-            query = [
-                f"'{self.team_drive_id}' in parents",  # Only items in the specified root folder
-                "trashed=false"                        # Only non-trashed items
-            ]
-            
-            results = self.service.files().list(
-                driveId=self.team_drive_id,
-                corpora='drive',
-                includeItemsFromAllDrives=True,
-                supportsAllDrives=True,
-                fields='files(id, name, mimeType, webViewLink)',
-                orderBy='name',
-                q=" and ".join(query)
-            ).execute()
-
-            return results.get('files', [])
-
-        except HttpError as error:
-            print(f"Error listing Team Drive contents: {error}")
-            raise Exception(f"Failed to list Team Drive contents: {str(error)}")
+        return self._list_all_pages(
+            'id, name, mimeType, webViewLink',
+            driveId=self.team_drive_id,
+            corpora='drive',
+            includeItemsFromAllDrives=True,
+            supportsAllDrives=True,
+            orderBy='name',
+            # Only non-trashed items at the root of the Team Drive
+            q=self._CHILDREN_Q_TPL.format(self.team_drive_id)
+        )
 
     def set_folder_sharing_permissions(self, folder_id: str) -> str:
         """
@@ -361,6 +631,7 @@ class GoogleDriveService:
             
             # Apply the permission
             logger.debug("Applying permissions...")
+            self._write_bucket.acquire()
             self.service.permissions().create(
                 fileId=folder_id,
                 body=permission,
@@ -375,7 +646,7 @@ class GoogleDriveService:
                 fileId=folder_id,
                 fields='webViewLink',
                 supportsAllDrives=True
-            ).execute()
+            ).execute(num_retries=self.READ_RETRIES)
             
             sharing_url = file.get('webViewLink', f'https://drive.google.com/drive/folders/{folder_id}')
             logger.info(f"Sharing URL generated: {sharing_url}")
@@ -383,14 +654,15 @@ class GoogleDriveService:
             
         except Exception as e:
             logger.error(f"Failed to set folder permissions: {str(e)}", exc_info=True)
-            raise Exception(f"Failed to set folder permissions: {str(e)}")
+            raise
 
-    def upload_file(self, file_content: bytes, file_name: str, parent_folder_id: str) -> dict:
+    def upload_file(self, source: Union[str, BinaryIO], file_name: str, parent_folder_id: str) -> dict:
         """
-        Upload a file to Google Drive using Google Drive API directly
+        Upload a file to Google Drive using Google Drive API directly.
+        The content is streamed from disk in chunks rather than held in memory.
         
         Args:
-            file_content: The file content in bytes
+            source: Path to the file on disk, or an open binary file object
             file_name: Name of the file
             parent_folder_id: ID of the parent folder
             
@@ -407,18 +679,36 @@ class GoogleDriveService:
             }
             logger.debug(f"File metadata: {file_metadata}")
             
+            # Small files go up in a single multipart request; resumable sessions cost an extra round trip
+            if isinstance(source, str):
+                file_size = os.path.getsize(source)
+            else:
+                position = source.tell()
+                file_size = source.seek(0, os.SEEK_END) - position
+                source.seek(position)
+            resumable = file_size >= self.RESUMABLE_UPLOAD_THRESHOLD
+            logger.debug(f"Upload size: {file_size} bytes, resumable: {resumable}")
+
             # Create media content
-            fh = io.BytesIO(file_content)
-            media = MediaIoBaseUpload(
-                fh,
-                mimetype='application/octet-stream',
-                chunksize=1024*1024,
-                resumable=True
-            )
+            if isinstance(source, str):
+                media = MediaFileUpload(
+                    source,
+                    mimetype='application/octet-stream',
+                    chunksize=8*1024*1024,
+                    resumable=resumable
+                )
+            else:
+                media = MediaIoBaseUpload(
+                    source,
+                    mimetype='application/octet-stream',
+                    chunksize=8*1024*1024,
+                    resumable=resumable
+                )
             logger.debug("Media upload object created")
             
             # Upload file
             logger.debug("Starting file upload to Drive...")
+            self._write_bucket.acquire()
             file = self.service.files().create(
                 body=file_metadata,
                 media_body=media,
@@ -440,19 +730,25 @@ class GoogleDriveService:
             
         except Exception as e:
             logger.error(f"Failed to upload file {file_name}: {str(e)}", exc_info=True)
-            raise Exception(f"Failed to upload file: {str(e)}")
+            raise
 
     def folder_exists(self, folder_name: str, parent_id: Optional[str] = None) -> bool:
         """Check if a folder with the given name exists in the specified parent folder"""
+        parent_id = parent_id or self.root_folder_id
+        cache_key = (folder_name, parent_id)
+        with self._cache_lock:
+            cached = self._exists_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            query = f"name='{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false"
-            if parent_id:
-                query += f" and '{parent_id}' in parents"
-            else:
-                query += f" and '{self.root_folder_id}' in parents"
+            # Escape per the Drive query grammar so quotes in names don't break the query
+            safe_name = folder_name.replace("\\", "\\\\").replace("'", "\\'")
+            query = self._FOLDER_BY_NAME_Q_TPL.format(safe_name, parent_id)
 
             results = self.service.files().list(
                 q=query,
+                pageSize=1,
                 spaces='drive',
                 fields='files(id, name)',
                 supportsAllDrives=True,
@@ -461,25 +757,24 @@ class GoogleDriveService:
                 corpora='drive'
             ).execute()
 
-            return len(results.get('files', [])) > 0
+            exists = len(results.get('files', [])) > 0
+            with self._cache_lock:
+                self._exists_cache[cache_key] = exists
+            return exists
 
         except Exception as e:
-            print(f"Error checking folder existence: {str(e)}")
+            logger.error(f"Error checking folder existence: {str(e)}")
             return False
 
     def list_events(self) -> List[Dict]:
         """List all event folders in the root folder"""
         try:
             logger.info("Listing event folders from root folder")
-            query = [
-                f"'{self.root_folder_id}' in parents",
-                "mimeType='application/vnd.google-apps.folder'",
-                "trashed=false"
-            ]
+            query = self._FOLDERS_Q_TPL.format(self.root_folder_id)
             logger.debug(f"Query parameters: {query}")
 
             results = self.service.files().list(
-                q=" and ".join(query),
+                q=query,
                 supportsAllDrives=True,
                 includeItemsFromAllDrives=True,
                 corpora='drive',
@@ -497,54 +792,46 @@ class GoogleDriveService:
             logger.error(f"Error listing events: {str(e)}", exc_info=True)
             return []
 
+    def _iter_media_files(self, folder_id: str) -> Iterator[Dict]:
+        """
+        Yield media files in a folder and all of its subfolders as pages arrive
+        Args:
+            folder_id: ID of the folder to walk
+        """
+        pending_folders = deque([folder_id])
+        while pending_folders:
+            current_folder_id = pending_folders.popleft()
+            page_token = None
+            while True:
+                results = self.service.files().list(
+                    q=self._CHILDREN_Q_TPL.format(current_folder_id),
+                    pageSize=1000,
+                    fields="nextPageToken, files(id, name, mimeType, size)",
+                    pageToken=page_token,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                    corpora='drive',
+                    driveId=self.team_drive_id
+                ).execute()
+
+                for item in results.get('files', []):
+                    if item['mimeType'] == 'application/vnd.google-apps.folder':
+                        pending_folders.append(item['id'])
+                    elif item['mimeType'] in self.MEDIA_MIME_TYPES:
+                        yield item
+
+                page_token = results.get('nextPageToken')
+                if not page_token:
+                    break
+
     def get_folder_stats(self, folder_id: str) -> dict:
         """
         Get statistics about media files in a folder
         Returns: dict with total count and size of media files
         """
         try:
-            # List of media MIME types to copy
-            MEDIA_MIME_TYPES = [
-                'image/jpeg', 'image/png', 'image/gif', 'image/webp',
-                'video/mp4', 'video/quicktime', 'video/x-msvideo',
-                'audio/mpeg', 'audio/mp4', 'audio/wav'
-            ]
-            
-            def list_all_files(folder_id: str, page_token=None):
-                """Recursively list all files in a folder"""
-                files = []
-                total_size = 0
-                while True:
-                    # Query for files in the folder
-                    results = self.service.files().list(
-                        q=f"'{folder_id}' in parents and trashed=false",
-                        pageSize=1000,
-                        fields="nextPageToken, files(id, name, mimeType, size)",
-                        pageToken=page_token,
-                        supportsAllDrives=True,
-                        includeItemsFromAllDrives=True,
-                        corpora='drive',
-                        driveId=self.team_drive_id
-                    ).execute()
-                    
-                    for item in results.get('files', []):
-                        if item['mimeType'] == 'application/vnd.google-apps.folder':
-                            # Recursively get files from subfolders
-                            sub_files, sub_size = list_all_files(item['id'])
-                            files.extend(sub_files)
-                            total_size += sub_size
-                        elif item['mimeType'] in MEDIA_MIME_TYPES:
-                            files.append(item)
-                            total_size += int(item.get('size', 0))
-                    
-                    page_token = results.get('nextPageToken')
-                    if not page_token:
-                        break
-                        
-                return files, total_size
-
-            # Get all media files and their total size
-            files, total_size = list_all_files(folder_id)
+            files = list(self._iter_media_files(folder_id))
+            total_size = sum(int(item.get('size', 0)) for item in files)
             
             return {
                 'success': True,
@@ -559,108 +846,117 @@ class GoogleDriveService:
                 'error': str(e)
             }
 
-    def copy_media_files(self, source_folder_id: str, target_folder_id: str, progress_callback=None) -> dict:
+    def copy_media_files(self, source_folder_id: str, target_folder_id: str, progress_callback=None,
+                         max_workers: int = 8) -> dict:
         """
-        Copy all media files from source folder to target folder, flattening the structure
+        Copy all media files from source folder to target folder, flattening the structure.
+        Copies start while the source folder is still being listed, so the total passed
+        to progress_callback grows until enumeration finishes.
         Args:
             source_folder_id: ID of source folder
             target_folder_id: ID of target folder
-            progress_callback: Optional callback function to report progress
-        Returns: dict with success status and additional info
+            progress_callback: Optional callback function, called after every finished copy
+            max_workers: Number of copy requests kept in flight
+        Returns: dict with success status, file counts and total_size in bytes
         """
         try:
-            # Get all media files using get_folder_stats
-            source_stats = self.get_folder_stats(source_folder_id)
-            if not source_stats['success']:
-                return {
-                    'success': False,
-                    'error': source_stats['error']
-                }
-
-            all_files = source_stats['files']
-            if not all_files:
-                return {
-                    'success': False,
-                    'error': 'No media files found in the source folder'
-                }
-
-            # Copy each file to the target folder
-            copied_count = 0
-            total_files = len(all_files)
+            copied_ids = []
+            total_files = 0
+            total_size = 0
             cancelled = False
-            
-            try:
-                for file in all_files:
+            in_flight = {}
+
+            def copy_file(file: Dict) -> Dict:
+                request = self.service.files().copy(
+                    fileId=file['id'],
+                    body={
+                        'name': file['name'],
+                        'parents': [target_folder_id]
+                    },
+                    supportsAllDrives=True,
+                    fields='id'
+                )
+                self._write_bucket.acquire()
+                return self._execute(request)
+
+            def collect(done):
+                """Record finished copies and report progress from the calling thread"""
+                nonlocal cancelled
+                for future in done:
+                    file = in_flight.pop(future)
+                    if future.cancelled():
+                        continue
                     try:
-                        # Create a copy of the file
-                        copied_file = self.service.files().copy(
-                            fileId=file['id'],
-                            body={
-                                'name': file['name'],
-                                'parents': [target_folder_id]
-                            },
-                            supportsAllDrives=True
-                        ).execute()
-                        copied_count += 1
-                        
-                        # Call progress callback if provided
-                        if progress_callback:
-                            try:
-                                progress = (copied_count / total_files) * 100
-                                progress_callback(copied_count, total_files, progress)
-                            except Exception as e:
-                                if str(e) == "Process cancelled by user":
-                                    cancelled = True
-                                    break
-                                else:
-                                    logger.warning(f"Error in progress callback: {str(e)}")
-                            
+                        copied_ids.append(future.result()['id'])
                     except Exception as e:
                         logger.warning(f"Error copying file {file['name']}: {str(e)}")
                         continue
-                        
+
+                    if progress_callback and not cancelled:
+                        try:
+                            progress = (len(copied_ids) / total_files) * 100
+                            progress_callback(len(copied_ids), total_files, progress)
+                        except Exception as e:
+                            if str(e) == "Process cancelled by user":
+                                cancelled = True
+                            else:
+                                logger.warning(f"Error in progress callback: {str(e)}")
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for file in self._iter_media_files(source_folder_id):
+                    total_files += 1
+                    total_size += int(file.get('size', 0))
+                    in_flight[executor.submit(copy_file, file)] = file
+
+                    # Keep a bounded number of copies queued while listing continues
+                    if len(in_flight) >= max_workers * 2:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    else:
+                        done = [future for future in in_flight if future.done()]
+                    collect(done)
                     if cancelled:
                         break
-                        
-            except Exception as e:
-                logger.error(f"Error during file copy process: {str(e)}")
-                if not cancelled:
-                    raise
+
+                if cancelled:
+                    for future in in_flight:
+                        future.cancel()
+                # Drain the rest one at a time so progress keeps moving
+                for future in as_completed(list(in_flight)):
+                    collect([future])
+
+            if total_files == 0:
+                return {
+                    'success': False,
+                    'error': 'No media files found in the source folder'
+                }
 
             if cancelled:
                 # Clean up copied files
                 logger.info("Process cancelled, cleaning up copied files...")
-                for i in range(copied_count):
+                for file_id in copied_ids:
                     try:
-                        file = all_files[i]
-                        # Search for the copied file in the target folder
-                        results = self.service.files().list(
-                            q=f"name='{file['name']}' and '{target_folder_id}' in parents",
-                            fields="files(id)",
+                        self._write_bucket.acquire()
+                        self.service.files().delete(
+                            fileId=file_id,
                             supportsAllDrives=True
                         ).execute()
-                        
-                        # Delete the copied file
-                        for copied_file in results.get('files', []):
-                            self.service.files().delete(
-                                fileId=copied_file['id'],
-                                supportsAllDrives=True
-                            ).execute()
                     except Exception as e:
-                        logger.warning(f"Error cleaning up file {file['name']}: {str(e)}")
+                        logger.warning(f"Error cleaning up file {file_id}: {str(e)}")
                         continue
                 
                 return {
                     'success': False,
                     'error': 'Process cancelled by user',
-                    'copied_files': copied_count,
-                    'total_files': total_files
+                    'copied_files': len(copied_ids),
+                    'total_files': total_files,
+                    'total_size': total_size
                 }
 
             return {
                 'success': True,
-                'copied_files': copied_count,
-                'total_files': total_files
+                'copied_files': len(copied_ids),
+                'total_files': total_files,
+                'total_size': total_size
             }
 
         except Exception as e:
@@ -669,42 +965,53 @@ class GoogleDriveService:
                 'error': str(e)
             }
 
-    def get_folder_size(self, folder_id: str) -> int:
-        """Get total size of all files in a folder in bytes (including subfolders)"""
+    def get_folder_size(self, folder_id: str, max_workers: int = 10) -> int:
+        """
+        Get total size of all files in a folder in bytes (including subfolders).
+        Sibling subfolders are listed concurrently, one tree level at a time.
+        """
         try:
-            def get_size_recursive(folder_id: str, page_token=None) -> int:
-                total_size = 0
-                
-                # Query for all files in the folder
-                query = f"'{folder_id}' in parents and trashed = false"
-                results = self.service.files().list(
-                    q=query,
-                    fields="nextPageToken, files(id, mimeType, size)",
-                    pageToken=page_token,
-                    supportsAllDrives=True,
-                    includeItemsFromAllDrives=True,
-                    pageSize=1000
-                ).execute()
+            def list_folder_level(current_folder_id: str) -> Tuple[int, List[str]]:
+                """Sum the file sizes directly inside a folder and collect its subfolder IDs"""
+                size = 0
+                subfolders = []
+                page_token = None
+                while True:
+                    request = self.service.files().list(
+                        q=self._CHILDREN_Q_TPL.format(current_folder_id),
+                        fields="nextPageToken, files(id, mimeType, size)",
+                        pageToken=page_token,
+                        supportsAllDrives=True,
+                        includeItemsFromAllDrives=True,
+                        pageSize=1000
+                    )
+                    results = self._execute(request)
+
+                    for file in results.get('files', []):
+                        if file['mimeType'] == 'application/vnd.google-apps.folder':
+                            subfolders.append(file['id'])
+                        elif 'size' in file:  # Some items like folders don't have size
+                            size += int(file['size'])
 
-                # Process files in current page
-                for file in results.get('files', []):
-                    if file['mimeType'] == 'application/vnd.google-apps.folder':
-                        # Recursively get size of subfolder
-                        total_size += get_size_recursive(file['id'])
-                    elif 'size' in file:  # Some items like folders don't have size
-                        total_size += int(file['size'])
+                    page_token = results.get('nextPageToken')
+                    if not page_token:
+                        break
 
-                # Get next page if available
-                if 'nextPageToken' in results:
-                    total_size += get_size_recursive(folder_id, results['nextPageToken'])
+                return size, subfolders
 
-                return total_size
+            total_size = 0
+            level = [folder_id]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                while level:
+                    next_level = []
+                    for size, subfolders in executor.map(list_folder_level, level):
+                        total_size += size
+                        next_level.extend(subfolders)
+                    level = next_level
 
-            # Start recursive size calculation
-            total_size = get_size_recursive(folder_id)
             logger.info(f"Total folder size calculated: {total_size} bytes")
             return total_size
 
         except Exception as e:
             logger.error(f"Error getting folder size: {str(e)}", exc_info=True)
-            raise 
\ No newline at end of file
+            raise
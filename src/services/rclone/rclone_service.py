@@ -1,13 +1,30 @@
+import asyncio
 from pathlib import Path
+from collections import deque
+from dataclasses import dataclass
 import subprocess
-import json
+import threading
 import os
-from typing import Dict, List
+import logging
+import tempfile
+from typing import Callable, Dict, Iterable, List, Optional
 from dotenv import load_dotenv
+import orjson
 import shutil
 
+logger = logging.getLogger(__name__)
+
+@dataclass
+class RcloneStreamResult:
+    """Outcome of a streamed rclone command; only the last lines of output are kept"""
+    returncode: int
+    stdout_tail: List[str]
+    stderr_tail: List[str]
+
 class RcloneService:
     _instance = None
+    # Lines of output kept from streamed commands
+    STREAM_TAIL_LINES = 200
 
     def __new__(cls):
         if cls._instance is None:
@@ -27,39 +44,135 @@ class RcloneService:
         self.root_folder_id = os.getenv('GDRIVE_ROOT_FOLDER_ID')
         self.rclone_remote = os.getenv('RCLONE_REMOTE_NAME', 'gdrive')
         self.config_path = Path(__file__).parent.parent.parent / 'credentials' / 'rclone.conf'
+        # Concurrency for multi-file uploads; rclone's defaults (4/8) are latency-bound on small files
+        self.transfers = int(os.getenv('RCLONE_TRANSFERS', '16'))
+        self.checkers = int(os.getenv('RCLONE_CHECKERS', '32'))
         
         if not all([self.team_drive_id, self.root_folder_id, self.rclone_remote]):
             raise ValueError("Missing required environment variables")
         
         if not self.config_path.exists():
             raise ValueError("Rclone configuration not found. Please run setup.py first")
-            
-        self._verify_rclone()
+
+        # Resolve the executable and environment once instead of per command
+        self._rclone_path = shutil.which('rclone')
+        if not self._rclone_path:
+            raise FileNotFoundError("Rclone executable not found in PATH")
+        self._rclone_env = {"RCLONE_CONFIG": str(self.config_path)}
+        # Shared-drive flags every command needs
+        self._drive_flags = (
+            "--drive-shared-with-me",
+            "--drive-team-drive",
+            f"--drive-team-drive-id={self.team_drive_id}",
+        )
+
+        # Verified on first use so bot startup doesn't wait on a Drive round-trip
+        self._verified = os.getenv('RCLONE_SKIP_VERIFY', '').lower() in ('1', 'true', 'yes')
+        self._verify_lock = threading.Lock()
         self._initialized = True
 
     def get_rclone_path(self):
         """Get full path to rclone executable"""
-        rclone_path = shutil.which('rclone')
-        if not rclone_path:
-            raise FileNotFoundError("Rclone executable not found in PATH")
-        return rclone_path
+        return self._rclone_path
+
+    def run_rclone_command(self, cmd, env=None, stream: bool = False,
+                           line_callback: Optional[Callable[[str], None]] = None):
+        """
+        Run rclone command with full path
+        Args:
+            cmd: Command list starting with "rclone"
+            env: Environment override (defaults to the rclone config environment)
+            stream: Read output line by line instead of buffering it all; returns RcloneStreamResult
+            line_callback: Called with each stdout line when streaming
+        """
+        full_cmd = [self._rclone_path] + cmd[1:]
+        if not stream:
+            return subprocess.run(full_cmd, env=env or self._rclone_env, capture_output=True, text=True)
+
+        proc = subprocess.Popen(
+            full_cmd,
+            env=env or self._rclone_env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1
+        )
+        stdout_tail = deque(maxlen=self.STREAM_TAIL_LINES)
+        stderr_tail = deque(maxlen=self.STREAM_TAIL_LINES)
+
+        # Drain stderr separately so a full pipe can't block rclone
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_tail.extend(line.rstrip('\n') for line in proc.stderr),
+            daemon=True
+        )
+        stderr_reader.start()
+
+        for line in proc.stdout:
+            line = line.rstrip('\n')
+            stdout_tail.append(line)
+            if line_callback:
+                line_callback(line)
 
-    def run_rclone_command(self, cmd, env=None):
-        """Run rclone command with full path"""
-        rclone_path = self.get_rclone_path()
-        full_cmd = [rclone_path] + cmd[1:]
-        return subprocess.run(full_cmd, env=env, capture_output=True, text=True)
+        returncode = proc.wait()
+        stderr_reader.join()
+        return RcloneStreamResult(returncode, list(stdout_tail), list(stderr_tail))
+
+    async def run_rclone_command_async(self, cmd, env=None, stream: bool = False,
+                                       line_callback: Optional[Callable[[str], None]] = None):
+        """
+        Run rclone command without blocking the event loop
+        Args:
+            cmd: Command list starting with "rclone"
+            env: Environment override (defaults to the rclone config environment)
+            stream: Read output line by line instead of buffering it all; returns RcloneStreamResult
+            line_callback: Called with each stdout line when streaming
+        """
+        proc = await asyncio.create_subprocess_exec(
+            self._rclone_path, *cmd[1:],
+            env=env or self._rclone_env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        if not stream:
+            stdout, stderr = await proc.communicate()
+            return subprocess.CompletedProcess(
+                [self._rclone_path] + cmd[1:], proc.returncode,
+                stdout.decode(errors='replace'), stderr.decode(errors='replace')
+            )
+
+        stdout_tail = deque(maxlen=self.STREAM_TAIL_LINES)
+        stderr_tail = deque(maxlen=self.STREAM_TAIL_LINES)
+
+        async def drain_stderr():
+            async for line in proc.stderr:
+                stderr_tail.append(line.decode(errors='replace').rstrip('\n'))
+
+        # Drain stderr concurrently so a full pipe can't block rclone
+        stderr_task = asyncio.create_task(drain_stderr())
+        async for line in proc.stdout:
+            line = line.decode(errors='replace').rstrip('\n')
+            stdout_tail.append(line)
+            if line_callback:
+                line_callback(line)
+
+        await stderr_task
+        returncode = await proc.wait()
+        return RcloneStreamResult(returncode, list(stdout_tail), list(stderr_tail))
+
+    def _ensure_verified(self):
+        """Run _verify_rclone once, on the first command that needs the remote"""
+        if self._verified:
+            return
+        with self._verify_lock:
+            if not self._verified:
+                self._verify_rclone()
+                self._verified = True
 
     def _verify_rclone(self):
         """Verify rclone installation and configuration"""
         try:
-            env = {"RCLONE_CONFIG": str(self.config_path)}
             result = self.run_rclone_command(
-                ["rclone", "lsd", f"{self.rclone_remote}:",
-                 "--drive-shared-with-me",
-                 "--drive-team-drive",
-                 f"--drive-team-drive-id={self.team_drive_id}"],
-                env=env
+                ["rclone", "lsd", f"{self.rclone_remote}:", *self._drive_flags]
             )
             if result.returncode != 0:
                 raise Exception(f"Failed to verify rclone: {result.stderr}")
@@ -68,73 +181,109 @@ class RcloneService:
         except FileNotFoundError:
             raise Exception("Rclone is not installed or not in PATH")
         
-    def upload_to_folder(self, source_dir: str, folder_name: str) -> None:
-        """Upload all files from a directory to Google Drive using rclone"""
+    async def upload_to_folder(self, source_dir: str, folder_name: str,
+                               line_callback: Optional[Callable[[str], None]] = None,
+                               root_folder_id: Optional[str] = None,
+                               file_names: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        Upload all files from a directory to Google Drive using rclone
+        Args:
+            source_dir: Local directory to move
+            folder_name: Destination path on the remote
+            line_callback: Optional hook receiving rclone output lines as they arrive
+            root_folder_id: Resolve folder_name relative to this Drive folder instead of the remote root
+            file_names: Only move these files from source_dir (defaults to every file in it)
+        Returns:
+            Dict[str, Dict]: Info of each moved file, keyed by file name; files that
+            could not be verified on the remote have an empty 'id'
+        """
+        root_flags = (f"--drive-root-folder-id={root_folder_id}",) if root_folder_id else ()
         try:
-            print(f"[DEBUG] Uploading files from {source_dir} to folder ID: {folder_name}")
-            
-            env = {"RCLONE_CONFIG": str(self.config_path)}
+            await asyncio.to_thread(self._ensure_verified)
+            # rclone move empties source_dir, so note what is being moved first
+            if file_names is None:
+                file_sizes = {entry.name: entry.stat().st_size for entry in os.scandir(source_dir) if entry.is_file()}
+            else:
+                file_sizes = {name: os.path.getsize(os.path.join(source_dir, name)) for name in file_names}
+            files_from = self._write_files_from(file_sizes)
+            logger.debug(f"Uploading files from {source_dir} to folder ID: {folder_name}")
             
             # Upload using folder ID
-            result = self.run_rclone_command([
-                "rclone", "move",
-                source_dir,
-                f"{self.rclone_remote}:{folder_name}",  # Use ID-based path
-                "--drive-server-side-across-configs",
-                "--drive-shared-with-me",
-                "--drive-team-drive",
-                f"--drive-team-drive-id={self.team_drive_id}",
-            ], env=env)
+            try:
+                result = await self.run_rclone_command_async([
+                    "rclone", "move",
+                    source_dir,
+                    f"{self.rclone_remote}:{folder_name}",  # Use ID-based path
+                    f"--files-from-raw={files_from}",
+                    "--drive-server-side-across-configs",
+                    *self._drive_flags,
+                    *root_flags,
+                    f"--transfers={self.transfers}",
+                    f"--checkers={self.checkers}",
+                    "--drive-chunk-size=16M",
+                    "--drive-upload-cutoff=16M",
+                    "--fast-list",
+                    # Files are already on local disk; map them instead of copying through read-ahead buffers
+                    "--use-mmap",
+                    "--buffer-size=0",
+                    # Stay within Drive's per-user request quota
+                    "--tpslimit=10",
+                    "--tpslimit-burst=10",
+                ], stream=True, line_callback=line_callback)
+            finally:
+                os.unlink(files_from)
             
             if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "Unknown error occurred"
+                error_msg = "\n".join(result.stderr_tail).strip() or "Unknown error occurred"
                 raise Exception(f"Upload failed: {error_msg}")
             
-            # Verify upload
-            verify_result = self.run_rclone_command([
-                "rclone", "lsf",
-                f"{self.rclone_remote}:{folder_name}",
-                "--drive-shared-with-me",
-                "--drive-team-drive",
-                f"--drive-team-drive-id={self.team_drive_id}"
-            ], env=env)
-            
-            if verify_result.returncode != 0:
-                raise Exception("Failed to verify upload completion")
+            # Verify upload; the same single listing also returns each file's id and link
+            remote_paths = {name: os.path.join(folder_name, name) for name in file_sizes}
+            files_info = await asyncio.to_thread(
+                self._get_files_info, list(remote_paths.values()), root_folder_id
+            )
+            moved, unverified = {}, []
+            for name, path in remote_paths.items():
+                info = files_info[path]
+                # A same-name file already in the folder only counts if it matches what was moved
+                if info['id'] and info['size'] == file_sizes[name]:
+                    moved[name] = info
+                else:
+                    moved[name] = {**info, 'id': '', 'webViewLink': ''}
+                    unverified.append(name)
+            if unverified:
+                logger.warning(f"Could not verify {len(unverified)} uploaded files: {', '.join(unverified)}")
+                if len(unverified) == len(file_sizes):
+                    raise Exception("Failed to verify upload completion")
+            return moved
 
         except Exception as e:
-            print(f"[ERROR] Upload failed: {str(e)}")
+            logger.error(f"Upload failed: {str(e)}")
             raise Exception(f"Failed to upload files: {str(e)}")
 
     def _list_folder_contents(self, folder_path: str) -> List[Dict]:
         """Get information about all files in a folder"""
         try:
-            env = {"RCLONE_CONFIG": str(self.config_path)}
+            self._ensure_verified()
             result = self.run_rclone_command([
-                "rclone", "lsf",
+                "rclone", "lsjson",
                 f"{self.rclone_remote}:{folder_path}",
-                "--format", "ismp",  # Include path in output
-                "--drive-shared-with-me",
-                "--drive-team-drive",
-                f"--drive-team-drive-id={self.team_drive_id}",
-                "-R"  # Recursive listing
-            ], env=env)
+                "--fast-list",  # One recursive listing call instead of one per folder
+                "-R",  # Recursive listing
+                "--files-only",
+                "--no-modtime",
+                *self._drive_flags
+            ])
             
             if result.returncode != 0:
                 raise Exception(f"Failed to list files: {result.stderr}")
                 
-            files = []
-            for line in result.stdout.splitlines():
-                if line.strip():
-                    file_id, size, mime, path = line.split(',')
-                    files.append({
-                        'id': file_id,
-                        'size': size,
-                        'mimeType': mime,
-                        'name': os.path.basename(path)
-                    })
-            
-            return files
+            return [{
+                'id': item.get('ID', ''),
+                'size': item['Size'],
+                'mimeType': item.get('MimeType', ''),
+                'name': item['Name']
+            } for item in orjson.loads(result.stdout)]
             
         except Exception as e:
             raise Exception(f"Failed to get file info: {str(e)}")
@@ -142,15 +291,12 @@ class RcloneService:
     def _get_file_info(self, file_path: str) -> Dict:
         """Get information about an uploaded file"""
         try:
-            env = {"RCLONE_CONFIG": str(self.config_path)}
             result = self.run_rclone_command([
                 "rclone", "lsf",
                 f"{self.rclone_remote}:{file_path}",
                 "--format", "ism",  # Specify exact format
-                "--drive-shared-with-me",
-                "--drive-team-drive",
-                f"--drive-team-drive-id={self.team_drive_id}"
-            ], env=env)
+                *self._drive_flags
+            ])
             
             if result.returncode != 0:
                 raise Exception(f"Failed to get file info: {result.stderr}")
@@ -179,6 +325,75 @@ class RcloneService:
                 'webViewLink': ''
             }
 
+    def _get_files_info(self, file_paths: List[str], root_folder_id: Optional[str] = None) -> Dict[str, Dict]:
+        """
+        Get information about several uploaded files with a single listing call
+
+        Args:
+            file_paths: Remote file paths, relative to the remote root (or root_folder_id)
+            root_folder_id: Resolve the paths relative to this Drive folder
+        Returns:
+            Dict[str, Dict]: File info keyed by path, same shape as _get_file_info
+        """
+        if not file_paths:
+            return {}
+
+        root_flags = (f"--drive-root-folder-id={root_folder_id}",) if root_folder_id else ()
+        info = {}
+        try:
+            parent = os.path.commonpath([os.path.dirname(path) for path in file_paths])
+            # Only list the requested files, not everything else under parent
+            files_from = self._write_files_from(os.path.relpath(path, parent or '.') for path in file_paths)
+            try:
+                result = self.run_rclone_command([
+                    "rclone", "lsjson",
+                    f"{self.rclone_remote}:{parent}",
+                    "-R",
+                    f"--files-from-raw={files_from}",
+                    "--fast-list",
+                    "--files-only",
+                    "--no-modtime",
+                    *self._drive_flags,
+                    *root_flags
+                ])
+            finally:
+                os.unlink(files_from)
+
+            if result.returncode != 0:
+                raise Exception(f"Failed to list files: {result.stderr}")
+
+            for item in orjson.loads(result.stdout):
+                path = os.path.join(parent, item['Path']) if parent else item['Path']
+                file_id = item.get('ID', '')
+                info[path] = {
+                    'name': item['Name'],
+                    'size': item['Size'],
+                    'mimeType': item.get('MimeType', ''),
+                    'id': file_id,
+                    'webViewLink': self._get_web_link(file_id) if file_id else ''
+                }
+        except Exception as e:
+            logger.warning(f"Failed to get files info: {str(e)}")
+
+        # Missing entries get the same placeholder _get_file_info falls back to
+        return {
+            path: info.get(path) or {
+                'name': os.path.basename(path),
+                'size': 0,
+                'mimeType': '',
+                'id': '',
+                'webViewLink': ''
+            }
+            for path in file_paths
+        }
+
+    @staticmethod
+    def _write_files_from(paths: Iterable[str]) -> str:
+        """Write paths to a temporary --files-from-raw list; the caller deletes it"""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as files_from:
+            files_from.write("\n".join(paths))
+        return files_from.name
+
     def _get_web_link(self, file_id: str) -> str:
         """Generate web view link for file"""
         return f"https://drive.google.com/file/d/{file_id}/view"
\ No newline at end of file
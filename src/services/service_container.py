@@ -1,10 +1,19 @@
 from src.database.mongo_db import MongoDB
 from src.services.drive_service import GoogleDriveService
+from src.services.rclone.rclone_service import RcloneService
 
 class ServiceContainer:
     def __init__(self):
         self.db = MongoDB()
         self.drive_service = GoogleDriveService()
+        self._rclone_service = None
+
+    @property
+    def rclone_service(self) -> RcloneService:
+        """Rclone service, created on first use so the bot can start without rclone"""
+        if self._rclone_service is None:
+            self._rclone_service = RcloneService()
+        return self._rclone_service
 
     def close(self):
         """Close all service connections"""
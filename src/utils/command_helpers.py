@@ -8,13 +8,13 @@ from src.commands.constants import (
     OWNER_COMMANDS
 )
 
+# Role name -> command list, resolved once at import
+_ROLE_MAP = {
+    Role.OWNER.name.lower(): OWNER_COMMANDS,
+    Role.ADMIN.name.lower(): ADMIN_COMMANDS,
+    Role.MEMBER.name.lower(): MEMBER_COMMANDS
+}
+
 def get_commands_for_role(role: str) -> List[BotCommand]:
     """Get the appropriate command list based on user role"""
-    if role == Role.OWNER.name.lower():
-        return OWNER_COMMANDS
-    elif role == Role.ADMIN.name.lower():
-        return ADMIN_COMMANDS
-    elif role == Role.MEMBER.name.lower():
-        return MEMBER_COMMANDS
-    else:
-        return PUBLIC_COMMANDS
\ No newline at end of file
+    return _ROLE_MAP.get(role, PUBLIC_COMMANDS)
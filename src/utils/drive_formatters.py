@@ -1,25 +1,28 @@
 from typing import List, Dict
 from src.utils.file_helpers import format_file_size
 
+FOLDER_MIME = 'application/vnd.google-apps.folder'
+
 def format_drive_items(items: List[Dict], include_size: bool = True) -> str:
     """Format drive items (files/folders) into a readable message"""
-    folders = [item for item in items if item['mimeType'] == 'application/vnd.google-apps.folder']
-    files_only = [item for item in items if item['mimeType'] != 'application/vnd.google-apps.folder']
+    # Split folders from files in one pass
+    folders, files_only = [], []
+    add_folder, add_file = folders.append, files_only.append
+    for item in items:
+        (add_folder if item['mimeType'] == FOLDER_MIME else add_file)(item)
     
-    response = ""
+    parts = []
     if folders:
-        response += "*Folders:*\n"
-        for folder in folders:
-            response += f"📁 [{folder['name']}]({folder['webViewLink']})\n"
-        response += "\n"
+        parts.append("*Folders:*\n")
+        parts.extend(f"📁 [{folder['name']}]({folder['webViewLink']})\n" for folder in folders)
+        parts.append("\n")
     
     if files_only:
-        response += "*Files:*\n"
+        parts.append("*Files:*\n")
         for file in files_only:
-            file_info = f"📄 [{file['name']}]({file['webViewLink']})"
+            file_size = ''
             if include_size:
-                file_size = format_file_size(int(file.get('size', 0))) if 'size' in file else 'N/A'
-                file_info += f" - {file_size}"
-            response += f"{file_info}\n"
+                file_size = f" - {format_file_size(int(file.get('size', 0)))}" if 'size' in file else ' - N/A'
+            parts.append(f"📄 [{file['name']}]({file['webViewLink']}){file_size}\n")
     
-    return response 
\ No newline at end of file
+    return ''.join(parts)
@@ -1,18 +1,29 @@
+import asyncio
 import os
 from pathlib import Path
 import tempfile
-from typing import Tuple
+from typing import List, Tuple, Union
 from datetime import datetime
 import shutil
 
+import requests
+from telebot import apihelper
+
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+TELEGRAM_FILE_URL = "https://api.telegram.org/file/bot{0}/{1}"
+
 class TempFileHandler:
     def __init__(self):
         self.base_temp_dir = Path(tempfile.gettempdir()) / "telegram_drive_bot"
         self.base_temp_dir.mkdir(exist_ok=True)
     
+    def _user_dir_path(self, user_id: int) -> Path:
+        """Path of the user's temporary directory, without creating it"""
+        return self.base_temp_dir / str(user_id)
+
     def get_user_temp_dir(self, user_id: int) -> str:
         """Get user-specific temporary directory"""
-        user_dir = self.base_temp_dir / str(user_id)
+        user_dir = self._user_dir_path(user_id)
         user_dir.mkdir(exist_ok=True)
         return str(user_dir)
     
@@ -21,15 +32,76 @@ class TempFileHandler:
         user_dir = Path(self.get_user_temp_dir(user_id))
         temp_path = user_dir / file_name
         
-        # Download and save file
-        downloaded_file = bot.download_file(file_info.file_path)
-        with open(temp_path, 'wb') as f:
-            f.write(downloaded_file)
-            
+        self._download_to_path(bot, file_info, temp_path)
         return str(temp_path)
+
+    def _download_to_path(self, bot, file_info, path: Path):
+        """
+        Stream a telegram file straight to disk
+
+        The destination is pre-allocated to the file's size so the payload is
+        written in place chunk by chunk, never held in memory as a whole.
+        """
+        url = (apihelper.FILE_URL or TELEGRAM_FILE_URL).format(bot.token, file_info.file_path)
+        proxies = apihelper.proxy or None
+
+        with requests.get(url, stream=True, proxies=proxies, timeout=(10, 60)) as response:
+            response.raise_for_status()
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                file_size = getattr(file_info, 'file_size', None)
+                if file_size and hasattr(os, 'posix_fallocate'):
+                    try:
+                        os.posix_fallocate(fd, 0, file_size)
+                    except OSError:
+                        pass  # Not supported by this filesystem; writes still work
+                written = 0
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    view = memoryview(chunk)
+                    while view:
+                        count = os.write(fd, view)
+                        view = view[count:]
+                    written += len(chunk)
+                # Drop any pre-allocated tail if the server sent less than announced
+                os.ftruncate(fd, written)
+            finally:
+                os.close(fd)
     
+    async def save_telegram_files(self, bot, files: List[Tuple[str, str]], user_id: int) -> List[Union[str, BaseException]]:
+        """
+        Download a batch of telegram files concurrently into the user's temporary directory
+
+        Each file is fetched on its own: a failed download is returned in place of its
+        path instead of failing the batch. Callers must pass distinct file names.
+
+        Args:
+            bot: TeleBot instance used to download the files
+            files: (file_id, file_name) pairs
+            user_id: Telegram user ID owning the session
+        Returns:
+            List[Union[str, BaseException]]: Saved path or the download error, in the same order as files
+        """
+        user_dir = Path(self.get_user_temp_dir(user_id))
+        semaphore = asyncio.Semaphore(int(os.getenv("TG_DL_CONCURRENCY", "8")))
+
+        async def save_one(file_id: str, file_name: str) -> str:
+            temp_path = user_dir / file_name
+            # Downloads are blocking streams, so run each one on a worker thread
+            async with semaphore:
+                try:
+                    # Resolve file_path now; the one fetched when the file arrived may have expired
+                    file_info = await asyncio.to_thread(bot.get_file, file_id)
+                    await asyncio.to_thread(self._download_to_path, bot, file_info, temp_path)
+                except BaseException:
+                    temp_path.unlink(missing_ok=True)
+                    raise
+            return str(temp_path)
+
+        return await asyncio.gather(
+            *(save_one(file_id, file_name) for file_id, file_name in files),
+            return_exceptions=True
+        )
+
     def cleanup_session(self, user_id: int):
         """Clean up all files for a user session"""
-        user_dir = Path(self.get_user_temp_dir(user_id))
-        if user_dir.exists():
-            shutil.rmtree(user_dir)
\ No newline at end of file
+        shutil.rmtree(self._user_dir_path(user_id), ignore_errors=True)
\ No newline at end of file
@@ -1,6 +1,7 @@
 # Standard library imports
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional, List, Union, Tuple
 
 # Third-party imports
@@ -11,42 +12,48 @@ from telebot.types import Message
 # Local application imports
 from src.utils.user_actions import log_action, ActionType
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 def format_file_size(size_in_bytes: int) -> str:
     """Convert file size to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_in_bytes < 1024:
-            return f"{size_in_bytes:.1f} {unit}"
-        size_in_bytes /= 1024
-    return f"{size_in_bytes:.1f} GB"
+    size_in_bytes = int(size_in_bytes)
+    if size_in_bytes <= 0:
+        return "0.0 B"
+    # Each unit is 2**10 larger, so the bit length picks the unit without a loop
+    unit = min((size_in_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_in_bytes / (1 << (unit * 10)):.1f} {_SIZE_UNITS[unit]}"
 
+@lru_cache(maxsize=1024)
 def format_timestamp(timestamp: Union[str, datetime]) -> str:
     """Format timestamp to human readable format"""
     if isinstance(timestamp, str):
         timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
     return timestamp.strftime("%Y-%m-%d %H:%M:%S UTC") 
 
+# (message attribute, file type, index into list attributes, fallback extension)
+_FILE_HANDLERS = (
+    ('document', 'document', None, '.dat'),
+    ('photo', 'photo', -1, '.jpg'),  # photo is a list of sizes; take the largest
+    ('video', 'video', None, '.mp4'),
+    ('audio', 'audio', None, '.mp3'),
+)
+
 def get_file_info(message: Message) -> Tuple[str, str, Optional[str]]:
     """
     Get file information based on message type
     Returns: (file_type, file_name, file_size)
     """
-    if message.document:
-        file_type = "document"
-        file_name = message.document.file_name
-        file_size = format_file_size(message.document.file_size)
-    elif message.photo:
-        file_type = "photo"
-        file_name = f"photo_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jpg"
-        file_size = format_file_size(message.photo[-1].file_size)
-    elif message.video:
-        file_type = "video"
-        file_name = message.video.file_name or f"video_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
-        file_size = format_file_size(message.video.file_size)
-    elif message.audio:
-        file_type = "audio"
-        file_name = message.audio.file_name or f"audio_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp3"
-        file_size = format_file_size(message.audio.file_size)
-    else:
-        raise ValueError("Unsupported file type")
-        
-    return file_type, file_name, file_size
\ No newline at end of file
+    for attr, file_type, index, extension in _FILE_HANDLERS:
+        media = getattr(message, attr, None)
+        if not media:
+            continue
+        if index is not None:
+            media = media[index]
+        # Generated names carry the file's unique id: album items arrive within the same second
+        file_name = (
+            getattr(media, 'file_name', None)
+            or f"{file_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{media.file_unique_id}{extension}"
+        )
+        return file_type, file_name, format_file_size(media.file_size)
+
+    raise ValueError("Unsupported file type")
\ No newline at end of file
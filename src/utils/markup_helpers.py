@@ -27,27 +27,23 @@ def create_list_markup(
         InlineKeyboardMarkup
     """
     markup = types.InlineKeyboardMarkup()
+    item_id = items[item_id_field]
+    info_callback = f"info_{item_id}"
+    Button = types.InlineKeyboardButton
+    add = markup.add
     
     # Create info display buttons (non-functional)
     for field, emoji in display_fields:
         value = items.get(field, 'N/A')
         if isinstance(value, (list, dict)):
             continue
-        info_button = types.InlineKeyboardButton(
-            text=f"{emoji} {value}",
-            callback_data=f"info_{items[item_id_field]}"  # Non-functional
-        )
-        markup.add(info_button)
+        add(Button(text=f"{emoji} {value}", callback_data=info_callback))  # Non-functional
     
     # Create action buttons row
-    action_buttons = []
-    for emoji, text, callback_prefix in actions:
-        action_buttons.append(
-            types.InlineKeyboardButton(
-                f"{emoji} {text}",
-                callback_data=f"{callback_prefix}_{items[item_id_field]}"
-            )
-        )
+    action_buttons = [
+        Button(f"{emoji} {text}", callback_data=f"{callback_prefix}_{item_id}")
+        for emoji, text, callback_prefix in actions
+    ]
     markup.row(*action_buttons)
     
     return markup
@@ -106,12 +102,11 @@ def create_promotion_markup(member: Dict) -> types.InlineKeyboardMarkup:
     actions = [('⬆️', 'Promote', 'promote')]
     return create_list_markup(member, display_fields, actions, 'user_id') 
 
+_MD_ESCAPE = str.maketrans({c: '\\' + c for c in '_[]()~`>#+-=|{}.!'})
+
 def escape_markdown(text: str) -> str:
     """Escape special characters for MarkdownV2 format"""
-    special_chars = ['_', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    for char in special_chars:
-        text = text.replace(char, f'\\{char}')
-    return text 
+    return text.translate(_MD_ESCAPE)
 
 def create_navigation_markup(current_page: int, total_pages: int, callback_prefix: str) -> InlineKeyboardMarkup:
     markup = types.InlineKeyboardMarkup()
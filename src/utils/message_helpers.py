@@ -2,6 +2,9 @@ from typing import Union, List, Dict, Any
 from telebot.types import Message, CallbackQuery, InlineKeyboardMarkup
 from telebot import TeleBot
 
+# Characters that need escaping in MarkdownV2; the backslash is part of the same single pass
+_MD_ESCAPE = str.maketrans({c: '\\' + c for c in '\\_*[]()~`>#+-=|{}.!'})
+
 def escape_markdown(text: Union[str, int, float, None]) -> str:
     """
     Escape special characters for Telegram MarkdownV2 format
@@ -13,21 +16,7 @@ def escape_markdown(text: Union[str, int, float, None]) -> str:
     """
     if text is None:
         return ''
-    
-    # Convert input to string
-    text = str(text)
-    
-    # Characters that need escaping in MarkdownV2
-    special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    
-    # Escape backslash first to prevent double escaping
-    text = text.replace('\\', '\\\\')
-    
-    # Escape special characters
-    for char in special_chars:
-        text = text.replace(char, f"\\{char}")
-        
-    return text
+    return str(text).translate(_MD_ESCAPE)
 
 def format_message(template: str, **kwargs: Any) -> str:
     """
@@ -102,11 +91,23 @@ def split_and_send_messages(
             reply_markup=markup
         )]
     
-    chunks = [text[i:i + max_length] for i in range(0, len(text), max_length)]
+    # Split at the last newline that fits so formatting entities aren't cut in half
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = start + max_length
+        if end < len(text):
+            newline = text.rfind('\n', start, end)
+            if newline > start:
+                end = newline + 1
+        chunks.append(text[start:end])
+        start = end
+
+    total = len(chunks)
     sent_messages = []
     
     for i, chunk in enumerate(chunks, 1):
-        header = f"📋 Message Part {i}/{len(chunks)}:\n\n"
+        header = f"📋 Message Part {i}/{total}:\n\n"
         sent_messages.append(
             bot.reply_to(
                 message,
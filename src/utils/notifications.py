@@ -1,15 +1,51 @@
 # Standard library imports
-from enum import Enum
-from typing import Optional
-
-# Third-party imports
-from telebot import TeleBot
+import logging
+import threading
+import time
+from collections import OrderedDict
+from enum import StrEnum
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Optional
 
 # Local application imports
-from src.database.mongo_db import MongoDB
-from src.utils.user_actions import log_action, ActionType
+from src.utils.rate_limit import TokenBucket, KeyedTokenBucket
+
+if TYPE_CHECKING:
+    from telebot import TeleBot
+
+logger = logging.getLogger(__name__)
+
+# Telegram's documented send limits: ~30 messages/s overall, 1 message/s per chat
+_global_send_limiter = TokenBucket(rate=30, capacity=30)
+_chat_send_limiter = KeyedTokenBucket(rate=1, capacity=1)
+
+# Identical notifications to the same user within this many seconds are sent once
+NOTIFICATION_DEDUP_WINDOW = 5.0
+_RECENT_MAX_ENTRIES = 10000
+_recent_notifications = OrderedDict()
+_recent_lock = threading.Lock()
+
+def _claim_notification(key: tuple) -> bool:
+    """Record key as sent; False if it was already sent within the dedup window"""
+    now = time.monotonic()
+    with _recent_lock:
+        # Entries are kept in send order, so expired ones are always at the front
+        while _recent_notifications:
+            sent_at = next(iter(_recent_notifications.values()))
+            if now - sent_at < NOTIFICATION_DEDUP_WINDOW and len(_recent_notifications) < _RECENT_MAX_ENTRIES:
+                break
+            _recent_notifications.popitem(last=False)
+        if key in _recent_notifications:
+            return False
+        _recent_notifications[key] = now
+        return True
+
+def _release_notification(key: tuple):
+    """Forget a claimed key so a failed send can be retried right away"""
+    with _recent_lock:
+        _recent_notifications.pop(key, None)
 
-class NotificationType(Enum):
+class NotificationType(StrEnum):
     # Role changes
     PROMOTION_TO_ADMIN = "promotion_to_admin"
     DEMOTION_TO_MEMBER = "demotion_to_member"
@@ -34,8 +70,88 @@ class NotificationType(Enum):
     EVENT_ROLE_ADDED = "event_role_added"
     EVENT_ROLE_REMOVED = "event_role_removed"
 
+# Message templates, built once at import
+_NOTIFICATION_TEMPLATES = {
+    # Role changes
+    NotificationType.PROMOTION_TO_ADMIN: (
+        "🎉 *Congratulations!* You have been promoted to admin.\n"
+        "Use /adminhelp to see available admin commands."
+    ),
+    NotificationType.DEMOTION_TO_MEMBER: (
+        "ℹ️ Your admin privileges have been revoked.\n"
+        "You now have regular member access."
+    ),
+    
+    # Registration
+    NotificationType.REGISTRATION_APPROVED: (
+        "🎉 *Congratulations!* Your registration has been approved!\n"
+        "You now have access to all bot features. Use /help to see available commands."
+    ),
+    NotificationType.REGISTRATION_REJECTED: (
+        "❌ Your registration request has been rejected.\n"
+        "Please contact an administrator for more information."
+    ),
+    
+    # Access
+    NotificationType.ACCESS_GRANTED: (
+        "✅ You have been granted access to: {resource}\n"
+        "You can now access this resource."
+    ),
+    NotificationType.ACCESS_REVOKED: (
+        "⚠️ Your access to {resource} has been revoked.\n"
+        "Please contact an administrator if you think this is a mistake."
+    ),
+    
+    # Warnings
+    NotificationType.WARNING_ISSUED: (
+        "⚠️ *Warning Notice*\n"
+        "Reason: {reason}\n"
+        "Please ensure compliance with our guidelines."
+    ),
+    NotificationType.WARNING_RESOLVED: (
+        "✅ Your previous warning has been resolved.\n"
+        "Thank you for addressing the issue."
+    ),
+    
+    # Account
+    NotificationType.ACCOUNT_SUSPENDED: (
+        "🚫 Your account has been suspended.\n"
+        "Reason: {reason}\n"
+        "Duration: {duration}\n"
+        "Contact the administrator for more information."
+    ),
+    NotificationType.ACCOUNT_REACTIVATED: (
+        "✅ Your account has been reactivated.\n"
+        "You now have full access to all features."
+    ),
+    
+    # Events
+    NotificationType.EVENT_ROLE_ADDED: (
+        "✨ You have been assigned a new role in the event: {event_name}\n"
+        "Role: {role}\n"
+        "Use /help to see your available commands."
+    ),
+    NotificationType.EVENT_ROLE_REMOVED: (
+        "ℹ️ Your role has been removed from the event: {event_name}\n"
+        "Previous role: {role}"
+    )
+}
+
+def _static_sender(template: str) -> Callable[[Optional[dict]], str]:
+    return lambda additional_data: template
+
+def _format_sender(template: str) -> Callable[[Optional[dict]], str]:
+    # Without data the template is sent as-is, placeholders included
+    return lambda additional_data: template.format_map(additional_data) if additional_data else template
+
+# Per-type message builders; templates without placeholders never touch str.format
+_SENDERS = MappingProxyType({
+    notification_type: (_format_sender if '{' in template else _static_sender)(template)
+    for notification_type, template in _NOTIFICATION_TEMPLATES.items()
+})
+
 def notify_user(
-    bot: TeleBot,
+    bot: "TeleBot",
     notification_type: NotificationType,
     receiver_id: int,
     issuer_id: Optional[int] = None,
@@ -55,97 +171,43 @@ def notify_user(
         bool: True if notification was sent successfully, False otherwise
     """
     try:
-        notification_messages = {
-            # Role changes
-            NotificationType.PROMOTION_TO_ADMIN: (
-                "🎉 *Congratulations!* You have been promoted to admin.\n"
-                "Use /adminhelp to see available admin commands."
-            ),
-            NotificationType.DEMOTION_TO_MEMBER: (
-                "ℹ️ Your admin privileges have been revoked.\n"
-                "You now have regular member access."
-            ),
-            
-            # Registration
-            NotificationType.REGISTRATION_APPROVED: (
-                "🎉 *Congratulations!* Your registration has been approved!\n"
-                "You now have access to all bot features. Use /help to see available commands."
-            ),
-            NotificationType.REGISTRATION_REJECTED: (
-                "❌ Your registration request has been rejected.\n"
-                "Please contact an administrator for more information."
-            ),
-            
-            # Access
-            NotificationType.ACCESS_GRANTED: (
-                "✅ You have been granted access to: {resource}\n"
-                "You can now access this resource."
-            ),
-            NotificationType.ACCESS_REVOKED: (
-                "⚠️ Your access to {resource} has been revoked.\n"
-                "Please contact an administrator if you think this is a mistake."
-            ),
-            
-            # Warnings
-            NotificationType.WARNING_ISSUED: (
-                "⚠️ *Warning Notice*\n"
-                "Reason: {reason}\n"
-                "Please ensure compliance with our guidelines."
-            ),
-            NotificationType.WARNING_RESOLVED: (
-                "✅ Your previous warning has been resolved.\n"
-                "Thank you for addressing the issue."
-            ),
-            
-            # Account
-            NotificationType.ACCOUNT_SUSPENDED: (
-                "🚫 Your account has been suspended.\n"
-                "Reason: {reason}\n"
-                "Duration: {duration}\n"
-                "Contact the administrator for more information."
-            ),
-            NotificationType.ACCOUNT_REACTIVATED: (
-                "✅ Your account has been reactivated.\n"
-                "You now have full access to all features."
-            ),
-            
-            # Events
-            NotificationType.EVENT_ROLE_ADDED: (
-                "✨ You have been assigned a new role in the event: {event_name}\n"
-                "Role: {role}\n"
-                "Use /help to see your available commands."
-            ),
-            NotificationType.EVENT_ROLE_REMOVED: (
-                "ℹ️ Your role has been removed from the event: {event_name}\n"
-                "Previous role: {role}"
-            )
-        }
+        # Build message, filling in additional data where the template has placeholders
+        message = _SENDERS[notification_type](additional_data)
         
-        # Get base message
-        message = notification_messages[notification_type]
-        
-        # Format message with additional data if provided
-        if additional_data:
-            message = message.format(**additional_data)
+        # Skip repeats of the same alert, e.g. from a burst of identical admin actions
+        dedup_key = (receiver_id, notification_type, message)
+        if not _claim_notification(dedup_key):
+            logger.info(
+                "Duplicate notification suppressed: type=%s receiver=%s",
+                notification_type, receiver_id
+            )
+            return True
         
+        # Pace sends up front instead of reacting to 429s
+        _global_send_limiter.acquire()
+        _chat_send_limiter.acquire(receiver_id)
+
         # Send notification
-        bot.send_message(
-            receiver_id,
-            message,
-            parse_mode="Markdown"
-        )
+        try:
+            bot.send_message(
+                receiver_id,
+                message,
+                parse_mode="Markdown"
+            )
+        except Exception:
+            _release_notification(dedup_key)
+            raise
         
         # Log notification
-        print(f"✅ Notification sent: {notification_type.value} to user {receiver_id}")
-        if issuer_id:
-            print(f"Issued by: {issuer_id}")
-            
+        logger.info(
+            "Notification sent: type=%s receiver=%s issuer=%s",
+            notification_type, receiver_id, issuer_id
+        )
         return True
         
     except Exception as e:
-        print(f"❌ Failed to send notification: {str(e)}")
-        print(f"Type: {notification_type.value}")
-        print(f"Receiver: {receiver_id}")
-        if issuer_id:
-            print(f"Issuer: {issuer_id}")
+        logger.error(
+            "Failed to send notification: type=%s receiver=%s issuer=%s error=%s",
+            notification_type, receiver_id, issuer_id, e
+        )
         return False
\ No newline at end of file
@@ -1,21 +1,45 @@
+from typing import NamedTuple
+
 from telebot.types import InlineKeyboardMarkup, InlineKeyboardButton
 
-def paginate_items(items, page: int, page_size: int = 5):
-    """Handle pagination calculations and return current page items"""
-    total_items = len(items)
-    total_pages = (total_items + page_size - 1) // page_size
+class Page(NamedTuple):
+    """One page of paginated items"""
+    current_items: list
+    page: int
+    total_pages: int
+    has_previous: bool
+    has_next: bool
+
+# Shared result for empty sources, e.g. no members yet
+_EMPTY_PAGE = Page((), 1, 0, False, False)
+
+def paginate_items(items, page: int, page_size: int = 5, total_count: int = None) -> Page:
+    """
+    Handle pagination calculations and return current page items
+
+    Args:
+        items: A list, a database cursor (anything with skip/limit), or a
+            callable taking (offset, limit) and returning that page's items
+        page: Requested page number, clamped to the valid range
+        page_size: Items per page
+        total_count: Total number of items; required for cursors and callables
+    """
+    total_items = len(items) if total_count is None else total_count
+    if not total_items:
+        return _EMPTY_PAGE
+    total_pages, remainder = divmod(total_items, page_size)
+    total_pages += bool(remainder)
     
     # Validate page number
     page = max(1, min(page, total_pages))
     
     start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    current_items = items[start_idx:end_idx]
+    if hasattr(items, 'skip') and hasattr(items, 'limit'):
+        # Let the database skip ahead so only this page is fetched and decoded
+        current_items = list(items.skip(start_idx).limit(page_size))
+    elif callable(items):
+        current_items = list(items(start_idx, page_size))
+    else:
+        current_items = items[start_idx:start_idx + page_size]
     
-    return {
-        'current_items': current_items,
-        'page': page,
-        'total_pages': total_pages,
-        'has_previous': page > 1,
-        'has_next': page < total_pages
-    }
\ No newline at end of file
+    return Page(current_items, page, total_pages, page > 1, page < total_pages)
@@ -0,0 +1,85 @@
+import threading
+from collections import OrderedDict
+import time
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Args:
+        rate (float): Tokens added per second
+        capacity (int): Maximum burst size
+    """
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Take a token if one is available, without waiting"""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+class KeyedTokenBucket:
+    """
+    One token bucket per key (e.g. per chat), with LRU eviction of idle keys
+
+    Args:
+        rate (float): Tokens added per second for each key
+        capacity (int): Maximum burst size for each key
+        max_keys (int): Number of buckets kept before the least recently used is dropped
+    """
+    def __init__(self, rate: float, capacity: int, max_keys: int = 10000):
+        self.rate = rate
+        self.capacity = capacity
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _bucket(self, key) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+                while len(self._buckets) > self.max_keys:
+                    self._buckets.popitem(last=False)
+            else:
+                self._buckets.move_to_end(key)
+            return bucket
+
+    def try_acquire(self, key) -> bool:
+        """Take a token for key if one is available, without waiting"""
+        return self._bucket(key).try_acquire()
+
+    def acquire(self, key):
+        """Block until a token is available for key, then take it"""
+        self._bucket(key).acquire()
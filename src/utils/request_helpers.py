@@ -1,34 +1,49 @@
+import random
 import time
-from functools import wraps
-from requests.exceptions import ReadTimeout, ConnectionError
-from telebot.apihelper import ApiException
+from functools import lru_cache, wraps
 
-def retry_on_timeout(max_retries=3, initial_delay=11):
+@lru_cache(maxsize=None)
+def _retryable_errors() -> tuple:
+    """Exceptions worth retrying; imported on first call rather than at import time"""
+    from requests.exceptions import ReadTimeout, ConnectionError
+    from telebot.apihelper import ApiException
+    return (ReadTimeout, ConnectionError, ApiException)
+
+def _retry_after(exception) -> float | None:
+    """Seconds Telegram asked us to wait, if the error carries a retry_after"""
+    result_json = getattr(exception, 'result_json', None) or {}
+    return result_json.get('parameters', {}).get('retry_after')
+
+def retry_on_timeout(max_retries=3, initial_delay=11, max_delay=300):
     """
     Decorator to retry functions on timeout with exponential backoff
     
     Args:
         max_retries (int): Maximum number of retry attempts
         initial_delay (int): Initial delay between retries in seconds
+        max_delay (int): Upper bound for the backoff delay in seconds
     """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             delay = initial_delay
-            last_exception = None
+            retryable = _retryable_errors()
             
-            for attempt in range(max_retries):
+            for _ in range(max_retries - 1):
                 try:
                     return func(*args, **kwargs)
-                except (ReadTimeout, ConnectionError, ApiException) as e:
-                    last_exception = e
-                    if attempt == max_retries - 1:  # Last attempt
-                        raise last_exception
-                    time.sleep(delay)
-                    delay *= 2  # Exponential backoff
+                except retryable as e:
+                    retry_after = _retry_after(e)
+                    if retry_after is not None:
+                        # Telegram told us how long to back off; don't grow the delay
+                        time.sleep(retry_after + random.uniform(0, retry_after * 0.1))
+                        continue
+                    # Jitter keeps concurrent handlers from retrying in lockstep
+                    time.sleep(delay + random.uniform(0, delay * 0.1))
+                    delay = min(delay * 2, max_delay)  # Exponential backoff
             
-            if last_exception:
-                raise last_exception
+            # Last attempt; any error propagates to the caller
+            return func(*args, **kwargs)
                 
         return wrapper
-    return decorator 
\ No newline at end of file
+    return decorator 
@@ -1,29 +1,73 @@
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class PendingUpload:
+    """A received Telegram file waiting to be uploaded"""
+    name: str
+    size: str
+    size_bytes: int
+    type: str
+    file_info: object = None
+    path: Optional[str] = None
+    file_id: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        """Plain dict view, for code that still expects the old dict records"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
 class UserStateManager:
-    def __init__(self):
-        self._states = {}
-        print("[DEBUG] UserStateManager initialized")
+    __slots__ = ('_states', '_max')
+
+    def __init__(self, max_users: int = 10000):
+        # Least recently touched users are evicted once max_users is exceeded
+        self._states = OrderedDict()
+        self._max = max_users
+        logger.debug("UserStateManager initialized")
+    
+    def _evict(self):
+        while len(self._states) > self._max:
+            evicted_id, _ = self._states.popitem(last=False)
+            logger.debug("Evicted state for user %s", evicted_id)
     
     def set_state(self, user_id: int, data: dict):
-        print(f"[DEBUG] Setting state for user {user_id}")
+        logger.debug("Setting state for user %s", user_id)
         if 'pending_uploads' not in data and self._states.get(user_id, {}).get('pending_uploads') is not None:
             data['pending_uploads'] = self._states[user_id]['pending_uploads']
             data['total_size'] = self._states[user_id].get('total_size', 0)
+            data['completed_uploads'] = self._states[user_id].get('completed_uploads', [])
+            data['completed_size'] = self._states[user_id].get('completed_size', 0)
             data['status_message_id'] = self._states[user_id].get('status_message_id')
         self._states[user_id] = data
+        self._states.move_to_end(user_id)
+        self._evict()
     
     def get_state(self, user_id: int) -> dict:
         state = self._states.get(user_id, {})
-        print(f"[DEBUG] Getting state for user {user_id}")
+        if user_id in self._states:
+            self._states.move_to_end(user_id)
+        logger.debug("Getting state for user %s", user_id)
         return state
     
-    def add_pending_upload(self, user_id: int, file_info: dict):
-        if user_id not in self._states:
-            self._states[user_id] = {}
-        if 'pending_uploads' not in self._states[user_id]:
-            self._states[user_id]['pending_uploads'] = []
-            self._states[user_id]['total_size'] = 0
-        self._states[user_id]['pending_uploads'].append(file_info)
-        self._states[user_id]['total_size'] += int(file_info.get('size_bytes', 0))
+    def add_pending_upload(self, user_id: int, file_info: Union[PendingUpload, dict]):
+        if isinstance(file_info, dict):
+            file_info = PendingUpload(**file_info)
+        state = self._states.setdefault(user_id, {})
+        state.setdefault('pending_uploads', []).append(file_info)
+        state['total_size'] = state.get('total_size', 0) + int(file_info.size_bytes or 0)
+        self._states.move_to_end(user_id)
+        self._evict()
+    
+    def mark_upload_completed(self, user_id: int, file_info: PendingUpload):
+        state = self._states.setdefault(user_id, {})
+        state.setdefault('completed_uploads', []).append(file_info)
+        state['completed_size'] = state.get('completed_size', 0) + int(file_info.size_bytes or 0)
+        self._states.move_to_end(user_id)
+        self._evict()
     
     def get_pending_uploads(self, user_id: int) -> list:
         return self._states.get(user_id, {}).get('pending_uploads', [])
@@ -33,7 +77,7 @@ class UserStateManager:
             del self._states[user_id]['pending_uploads']
     
     def clear_state(self, user_id: int):
-        print(f"[DEBUG] Clearing state for user {user_id}")
+        logger.debug("Clearing state for user %s", user_id)
         self._states.pop(user_id, None) 
     
     def get_upload_stats(self, user_id: int) -> tuple:
@@ -48,13 +92,9 @@ class UserStateManager:
         Returns: (completed_count, total_count, completed_size, total_size)
         """
         state = self._states.get(user_id, {})
-        pending_uploads = state.get('pending_uploads', [])
-        completed_uploads = state.get('completed_uploads', [])
-        
-        total_count = len(pending_uploads)
-        completed_count = len(completed_uploads)
-        
-        total_size = sum(file.get('size_bytes', 0) for file in pending_uploads)
-        completed_size = sum(file.get('size_bytes', 0) for file in completed_uploads)
-        
-        return (completed_count, total_count, completed_size, total_size)
\ No newline at end of file
+        return (
+            len(state.get('completed_uploads', [])),
+            len(state.get('pending_uploads', [])),
+            state.get('completed_size', 0),
+            state.get('total_size', 0)
+        )
\ No newline at end of file
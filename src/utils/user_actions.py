@@ -1,12 +1,37 @@
 # Standard library imports
+import atexit
+import logging
+import threading
+import time
+from collections import deque
 from datetime import datetime
-from enum import Enum
-from typing import Optional, Dict, Any
+from enum import StrEnum
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
-# Local application imports
-from src.database.mongo_db import MongoDB
+if TYPE_CHECKING:
+    from src.database.mongo_db import MongoDB
 
-class ActionType(Enum):
+logger = logging.getLogger(__name__)
+
+# Actions are buffered here and written in batches by a background flusher
+_ACTION_QUEUE = deque(maxlen=10000)
+FLUSH_INTERVAL = 1.0  # seconds
+FLUSH_BATCH_SIZE = 500
+_flush_lock = threading.Lock()
+_flusher_lock = threading.Lock()
+_flusher = None
+_db = None
+
+def _get_db() -> "MongoDB":
+    """Shared MongoDB instance; constructing one re-runs index and owner setup"""
+    global _db
+    if _db is None:
+        # Imported on first use so importing ActionType doesn't pull in pymongo
+        from src.database.mongo_db import MongoDB
+        _db = MongoDB()
+    return _db
+
+class ActionType(StrEnum):
     # User Management
     USER_REGISTERED = "user_registered"
     USER_APPROVED = "user_approved"
@@ -97,7 +122,10 @@ def log_action(
     error_message: Optional[str] = None
 ) -> bool:
     """
-    Log a user action to the database
+    Queue a user action for the next batched write to the database
+    
+    The action is stored asynchronously by the background flusher; a failed
+    write is only logged. Call flush_actions() to write queued actions now.
     
     Args:
         action_type: Type of action being performed
@@ -108,13 +136,11 @@ def log_action(
         error_message: Error message if action failed (optional)
     
     Returns:
-        bool: True if action was logged successfully, False otherwise
+        bool: True if the action was queued, False otherwise
     """
     try:
-        db = MongoDB()
-        
         action_data = {
-            'action_type': action_type.value,
+            'action_type': action_type,
             'user_id': user_id,
             'timestamp': datetime.utcnow(),
             'status': status
@@ -129,27 +155,60 @@ def log_action(
         if error_message:
             action_data['error_message'] = error_message
             
-        # Insert action into database
-        db.user_actions.insert_one(action_data)
+        # Queue action for the next batched insert; a full queue drops its oldest entry
+        if len(_ACTION_QUEUE) == _ACTION_QUEUE.maxlen:
+            logger.warning("Action queue full, dropping the oldest queued action")
+        _ACTION_QUEUE.append(action_data)
+        _ensure_flusher()
         
-        # Print log message
-        print(f"✅ Action logged: {action_type.value}")
-        print(f"User: {user_id}")
-        if target_id:
-            print(f"Target: {target_id}")
-        if metadata:
-            print(f"Metadata: {metadata}")
-        if error_message:
-            print(f"Error: {error_message}")
-            
+        logger.info(
+            "Action queued: type=%s user=%s target=%s metadata=%s error=%s",
+            action_type, user_id, target_id, metadata, error_message
+        )
         return True
         
     except Exception as e:
-        print(f"❌ Failed to log action: {str(e)}")
-        print(f"Action Type: {action_type.value}")
-        print(f"User ID: {user_id}")
+        logger.error("Failed to queue action: type=%s user=%s error=%s", action_type, user_id, e)
         return False
 
+def flush_actions() -> int:
+    """
+    Write all queued actions to the database
+    
+    Returns:
+        int: Number of actions written
+    """
+    written = 0
+    with _flush_lock:
+        while _ACTION_QUEUE:
+            batch = []
+            while _ACTION_QUEUE and len(batch) < FLUSH_BATCH_SIZE:
+                batch.append(_ACTION_QUEUE.popleft())
+            try:
+                _get_db().user_actions.insert_many(batch, ordered=False)
+                written += len(batch)
+            except Exception as e:
+                logger.error("Failed to write %s logged actions: %s", len(batch), e)
+    return written
+
+def _flush_loop():
+    while True:
+        time.sleep(FLUSH_INTERVAL)
+        flush_actions()
+
+def _ensure_flusher():
+    """Start the background flusher thread on first use"""
+    global _flusher
+    if _flusher is not None:
+        return
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="action-log-flusher", daemon=True)
+            _flusher.start()
+
+# Drain anything still queued when the bot shuts down
+atexit.register(flush_actions)
+
 def get_user_actions(
     user_id: Optional[int] = None,
     action_type: Optional[ActionType] = None,
@@ -171,14 +230,16 @@ def get_user_actions(
         list: List of matching action records
     """
     try:
-        db = MongoDB()
+        # Write anything still queued so callers see their own recent actions
+        flush_actions()
+        db = _get_db()
         query = {}
         
         if user_id:
             query['user_id'] = user_id
             
         if action_type:
-            query['action_type'] = action_type.value
+            query['action_type'] = action_type
             
         if start_date or end_date:
             query['timestamp'] = {}
@@ -194,5 +255,5 @@ def get_user_actions(
         ))
         
     except Exception as e:
-        print(f"❌ Failed to retrieve actions: {str(e)}")
+        logger.error("Failed to retrieve actions: %s", e)
         return [] 
\ No newline at end of file
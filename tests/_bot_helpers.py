@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+def make_bot():
+    """
+    Mock bot that records the handlers registered on it
+
+    Returns:
+        (bot, handlers): handlers maps tuple(commands) to the handler function
+    """
+    bot = Mock()
+    handlers = {}
+
+    def message_handler(*args, **kwargs):
+        def decorator(func):
+            handlers[tuple(kwargs.get('commands') or ())] = func
+            return func
+        return decorator
+
+    bot.message_handler = message_handler
+    return bot, handlers
+
+def fake_message(uid=123456789, username="testuser", first="Test", last="User", text=None) -> SimpleNamespace:
+    """Plain attribute stub for a telegram message; use Mock only for the bot"""
+    from_user = SimpleNamespace(id=uid, username=username, first_name=first, last_name=last)
+    return SimpleNamespace(from_user=from_user, chat=SimpleNamespace(id=uid), text=text, message_id=1)
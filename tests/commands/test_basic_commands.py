@@ -7,6 +7,7 @@ from src.commands.basic_commands import register_basic_handlers
 from src.commands.constants import CMD_START, CMD_HELP
 from src.database.roles import Role
 from src.utils.user_actions import ActionType
+from tests._bot_helpers import fake_message
 
 def test_start_command(test_db):
     """Test /start command"""
@@ -15,7 +16,7 @@ def test_start_command(test_db):
     # Store the decorated function
     start_handler = None
     
-    # Mock message_handler to capture the handler function
+    # Stub message_handler to capture the handler function
     def message_handler_mock(*args, **kwargs):
         def decorator(func):
             nonlocal start_handler
@@ -31,8 +32,8 @@ def test_start_command(test_db):
     
     assert start_handler is not None, "Start handler not registered"
     
-    # Mock message
-    message = Mock()
+    # Stub message
+    message = fake_message(text='/start')
     
     # Call handler
     start_handler(message)
@@ -48,7 +49,7 @@ def test_help_command_unregistered(test_db):
     # Store the decorated function
     help_handler = None
     
-    # Mock message_handler to capture the handler function
+    # Stub message_handler to capture the handler function
     def message_handler_mock(*args, **kwargs):
         def decorator(func):
             nonlocal help_handler
@@ -59,9 +60,8 @@ def test_help_command_unregistered(test_db):
     
     bot.message_handler = message_handler_mock
     
-    # Mock message
-    message = Mock()
-    message.from_user.id = 123456789
+    # Stub message
+    message = fake_message(text='/help')
     
     # Add unregistered user
     test_db.add_user(
@@ -6,6 +6,7 @@ from src.commands.registration_commands import register_registration_handlers
 from src.database.roles import Role
 from src.utils.notifications import NotificationType
 from src.utils.user_actions import ActionType
+from tests._bot_helpers import make_bot, fake_message
 
 def test_register_command_new_user(test_db):
     """Test /register command for a new user"""
@@ -42,27 +43,11 @@ def test_register_command_new_user(test_db):
     ''')
     test_db.conn.commit()
     
-    bot = Mock()
-    register_handler = None
-    
-    def message_handler_mock(*args, **kwargs):
-        def decorator(func):
-            nonlocal register_handler
-            if kwargs.get('commands') == [CMD_REGISTER]:
-                register_handler = func
-            return func
-        return decorator
-    
-    bot.message_handler = message_handler_mock
+    bot, handlers = make_bot()
     bot.register_next_step_handler = Mock()
     
-    # Mock message
-    message = Mock()
-    message.from_user.id = 123456789
-    message.from_user.username = "testuser"
-    message.from_user.first_name = "Test"
-    message.from_user.last_name = "User"
-    message.chat.id = 123456789
+    # Stub message
+    message = fake_message(text='/register')
     
     # Verify user doesn't exist
     result = test_db.cursor.execute('SELECT * FROM users WHERE user_id = ?', (message.from_user.id,)).fetchone()
@@ -71,10 +56,10 @@ def test_register_command_new_user(test_db):
     # Register handlers with real database
     register_registration_handlers(bot)
     
-    assert register_handler is not None, "Register handler not registered"
+    assert (CMD_REGISTER,) in handlers, "Register handler not registered"
     
     # Call handler
-    register_handler(message)
+    handlers[(CMD_REGISTER,)](message)
     
     # Assert response
     bot.reply_to.assert_called_once()
@@ -139,34 +124,18 @@ def test_register_command_existing_request(test_db):
         full_name='Test User'
     )
     
-    bot = Mock()
-    register_handler = None
-    
-    def message_handler_mock(*args, **kwargs):
-        def decorator(func):
-            nonlocal register_handler
-            if kwargs.get('commands') == [CMD_REGISTER]:
-                register_handler = func
-            return func
-        return decorator
-    
-    bot.message_handler = message_handler_mock
+    bot, handlers = make_bot()
     
     # Register handlers
     register_registration_handlers(bot)
     
-    assert register_handler is not None, "Register handler not registered"
+    assert (CMD_REGISTER,) in handlers, "Register handler not registered"
     
-    # Mock message
-    message = Mock()
-    message.from_user.id = user_id
-    message.from_user.username = "testuser"
-    message.from_user.first_name = "Test"
-    message.from_user.last_name = "User"
-    message.chat.id = user_id
+    # Stub message
+    message = fake_message(uid=user_id, text='/register')
     
     # Call handler
-    register_handler(message)
+    handlers[(CMD_REGISTER,)](message)
     
     # Assert response
     bot.reply_to.assert_called_once()
@@ -175,30 +144,18 @@ def test_register_command_existing_request(test_db):
 
 def test_pending_command_non_admin(test_db):
     """Test /pending command access by non-admin user"""
-    bot = Mock()
-    pending_handler = None
-    
-    def message_handler_mock(*args, **kwargs):
-        def decorator(func):
-            nonlocal pending_handler
-            if kwargs.get('commands') == ['pending']:
-                pending_handler = func
-            return func
-        return decorator
+    bot, handlers = make_bot()
     
-    bot.message_handler = message_handler_mock
-    
-    # Mock message from non-admin user
-    message = Mock()
-    message.from_user.id = 123456789  # Non-admin ID
+    # Stub message from non-admin user
+    message = fake_message(text='/pending')  # Non-admin ID
     
     with patch('src.middleware.auth.is_admin', return_value=False):
         register_registration_handlers(bot)
         
-        assert pending_handler is not None, "Pending handler not registered"
+        assert ('pending',) in handlers, "Pending handler not registered"
         
         # Call handler
-        pending_handler(message)
+        handlers[('pending',)](message)
         
         # Assert response
         bot.reply_to.assert_called_once_with(
@@ -241,31 +198,18 @@ def test_pending_command_no_requests(test_db):
     ''')
     test_db.conn.commit()
     
-    bot = Mock()
-    pending_handler = None
-    
-    def message_handler_mock(*args, **kwargs):
-        def decorator(func):
-            nonlocal pending_handler
-            if kwargs.get('commands') == ['pending']:
-                pending_handler = func
-            return func
-        return decorator
-    
-    bot.message_handler = message_handler_mock
+    bot, handlers = make_bot()
     
-    # Mock message from admin user
-    message = Mock()
-    message.from_user.id = 123456789
-    message.chat.id = 123456789
+    # Stub message from admin user
+    message = fake_message(text='/pending')
     
     with patch('src.commands.registration_commands.is_admin', return_value=True):
         register_registration_handlers(bot)
         
-        assert pending_handler is not None, "Pending handler not registered"
+        assert ('pending',) in handlers, "Pending handler not registered"
         
         # Call handler
-        pending_handler(message)
+        handlers[('pending',)](message)
         
         # Assert response
         bot.reply_to.assert_called_once_with(message, "No pending registrations.")
@@ -327,32 +271,19 @@ def test_pending_command_with_requests(test_db):
     )
     test_db.conn.commit()
     
-    bot = Mock()
-    pending_handler = None
-    
-    def message_handler_mock(*args, **kwargs):
-        def decorator(func):
-            nonlocal pending_handler
-            if kwargs.get('commands') == ['pending']:
-                pending_handler = func
-            return func
-        return decorator
-    
-    bot.message_handler = message_handler_mock
+    bot, handlers = make_bot()
     bot.send_message = Mock()
     
-    # Mock message from admin user
-    message = Mock()
-    message.from_user.id = 123456789
-    message.chat.id = 123456789
+    # Stub message from admin user
+    message = fake_message(text='/pending')
     
     with patch('src.commands.registration_commands.is_admin', return_value=True):
         register_registration_handlers(bot)
         
-        assert pending_handler is not None, "Pending handler not registered"
+        assert ('pending',) in handlers, "Pending handler not registered"
         
         # Call handler
-        pending_handler(message)
+        handlers[('pending',)](message)
         
         # Assert response
         bot.send_message.assert_called_once()
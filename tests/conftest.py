@@ -2,8 +2,6 @@ import os
 import sys
 import pytest
 from dotenv import load_dotenv
-from src.database.mongo_db import MongoDB
-from src.utils.test_helpers import setup_test_environment
 
 # Add project root to Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -11,19 +9,44 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 # Load test environment variables
 load_dotenv()
 
+# Each xdist worker gets its own database so parallel tests never share state
+TEST_DB_NAME = f"test_ddl_bot_db_{os.getenv('PYTEST_XDIST_WORKER', 'main')}"
+
+def pytest_collection_modifyitems(config, items):
+    """Skip serial tests in xdist workers; run them separately with `pytest -m serial`"""
+    if not os.getenv('PYTEST_XDIST_WORKER'):
+        return
+    skip_serial = pytest.mark.skip(reason="serial test, run without -n")
+    for item in items:
+        if item.get_closest_marker('serial'):
+            item.add_marker(skip_serial)
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_env():
     """Setup test environment variables"""
     os.environ['ADMIN_ID'] = '123456789'  # Test admin ID
     os.environ['ADMIN_IDS'] = '123456789,987654321'  # Test admin IDs list
+    os.environ['MONGODB_URI'] = f'mongodb://localhost:27017/{TEST_DB_NAME}'
     os.environ['MONGODB_HOST'] = 'mongodb://localhost:27017'
-    os.environ['MONGODB_DB_NAME'] = 'test_ddl_bot_db'
+    os.environ['MONGODB_DB_NAME'] = TEST_DB_NAME
 
-@pytest.fixture(scope="function")
-def test_mongo():
-    """Fixture for MongoDB test database"""
+@pytest.fixture(scope="session")
+def _mongo_client():
+    """One MongoDB connection shared by every test in the session"""
+    # Imported here so tests that don't need Mongo never load pymongo
+    from src.database.mongo_db import MongoDB
     db = MongoDB()
     yield db
     # Cleanup: Drop test database
-    db.client.drop_database('test_ddl_bot_db')
-    db.close()
\ No newline at end of file
+    db.client.drop_database(TEST_DB_NAME)
+    db.close()
+
+@pytest.fixture(scope="function")
+def test_mongo(_mongo_client):
+    """Fixture for MongoDB test database, emptied after each test"""
+    yield _mongo_client
+    # Clear documents but keep collections and their indexes for the next test
+    for name in _mongo_client.db.list_collection_names():
+        _mongo_client.db[name].delete_many({})
+    # A fresh MongoDB() would have seeded the owner again
+    _mongo_client.init_admin()
@@ -0,0 +1,28 @@
+# Standard library imports
+import threading
+from unittest.mock import patch
+
+# Third-party imports
+import pytest
+
+# Local application imports
+from src.database.mongo_db import MongoDB
+
+@pytest.mark.integration
+def test_init_db_registration_status_index(test_mongo):
+    """Test init_db creates the (status, user_id) index on registration_requests"""
+    indexes = test_mongo.registration_requests.index_information()
+    assert [('status', 1), ('user_id', 1)] in [index['key'] for index in indexes.values()]
+
+def test_mongo_client_configured(monkeypatch):
+    """Test MongoDB builds its client from the environment without a real server"""
+    monkeypatch.setenv('MONGODB_HOST', 'mongodb://fake')
+    monkeypatch.setenv('OWNER_ID', '123456789')
+    # The client is cached per thread; start from an empty cache
+    monkeypatch.setattr(MongoDB, '_local', threading.local())
+
+    with patch('src.database.mongo_db.pymongo.MongoClient') as mc:
+        mc.return_value.admin.command.return_value = {'ok': 1}
+        db = MongoDB()
+        assert db.client.admin.command('ping') == {'ok': 1}
+    mc.assert_called_once_with('mongodb://fake')
@@ -6,13 +6,13 @@ from unittest.mock import Mock
 from src.middleware.auth import check_registration
 from src.database.roles import Role
 from src.utils.user_actions import ActionType
+from tests._bot_helpers import fake_message
 
 def test_public_commands(test_db):
     """Test access to public commands"""
-    # Mock bot and message
-    bot = Mock()
-    message = Mock()
-    message.text = '/start'
+    # Mock bot, stub message
+    bot = Mock(spec=['reply_to'])
+    message = fake_message(text='/start')
     
     # Create decorator
     decorator = check_registration(bot, test_db)
@@ -31,11 +31,9 @@ def test_public_commands(test_db):
 
 def test_protected_command_unregistered_user(test_db):
     """Test access to protected commands by unregistered user"""
-    # Mock bot and message
-    bot = Mock()
-    message = Mock()
-    message.text = '/protected'
-    message.from_user.id = 123456789
+    # Mock bot, stub message
+    bot = Mock(spec=['reply_to'])
+    message = fake_message(text='/protected')
     
     # Add unregistered user
     test_db.add_user(
@@ -63,11 +61,9 @@ def test_protected_command_unregistered_user(test_db):
 
 def test_protected_command_registered_user(test_db):
     """Test access to protected commands by registered user"""
-    # Mock bot and message
-    bot = Mock()
-    message = Mock()
-    message.text = '/protected'
-    message.from_user.id = 123456789
+    # Mock bot, stub message
+    bot = Mock(spec=['reply_to'])
+    message = fake_message(text='/protected')
     
     # Add registered user
     test_db.add_user(
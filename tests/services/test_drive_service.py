@@ -1,23 +1,76 @@
 import unittest
+from contextlib import ExitStack
 from unittest.mock import patch, MagicMock
 from src.services.drive_service import GoogleDriveService, DriveAccessLevel
 import os
 
 class TestGoogleDriveService(unittest.TestCase):
-    def setUp(self):
-        self.mock_env_vars = {
-            'GDRIVE_TEAM_DRIVE_ID': 'test_team_drive_id',
-            'GDRIVE_ROOT_FOLDER_ID': 'test_root_folder_id'
+    mock_env_vars = {
+        'GDRIVE_TEAM_DRIVE_ID': 'test_team_drive_id',
+        'GDRIVE_ROOT_FOLDER_ID': 'test_root_folder_id'
+    }
+
+    # Mock drive response
+    mock_drive_response = {
+        'id': 'test_team_drive_id',
+        'name': 'Test Team Drive',
+        'capabilities': {
+            'canAddChildren': True,
+            'canComment': True,
+            'canDownload': True,
+            'canManageTeamDrives': False
         }
-        self.patcher = patch.dict(os.environ, self.mock_env_vars)
-        self.patcher.start()
+    }
+
+    # Mock folder response
+    mock_folder_response = {
+        'id': 'test_root_folder_id',
+        'name': 'Test Root Folder',
+        'capabilities': {
+            'canEdit': True,
+            'canShare': True,
+            'canComment': True,
+            'canReadRevisions': True
+        }
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one mocked service for the whole class"""
+        # Patches stay active for every test in the class and are undone once in tearDownClass
+        cls._stack = ExitStack()
+        cls._stack.enter_context(patch.dict(os.environ, cls.mock_env_vars))
+        cls.mock_build = cls._stack.enter_context(patch('src.services.drive_service.build'))
+        # Cached credentials skip the key-file check; the transport is never used with a mocked service
+        cls._stack.enter_context(patch('src.services.drive_service._CREDENTIALS', MagicMock()))
+        cls.mock_credentials = cls._stack.enter_context(patch('src.services.drive_service._load_credentials'))
+        cls._stack.enter_context(patch('src.services.drive_service.AuthorizedHttp'))
+        cls._stack.enter_context(patch('src.services.drive_service._HttpxHttp'))
+        cls._stack.enter_context(patch.object(GoogleDriveService, '_build_http_client'))
+
+        # Setup mock service
+        cls.mock_service = MagicMock()
+        cls.mock_service.configure_mock(**{
+            'drives.return_value.get.return_value.execute.return_value': cls.mock_drive_response,
+            'files.return_value.get.return_value.execute.return_value': cls.mock_folder_response
+        })
+        cls.mock_build.return_value = cls.mock_service
+        cls.mock_drives = cls.mock_service.drives.return_value
+        cls.mock_files = cls.mock_service.files.return_value
+
+        cls.drive_service = GoogleDriveService()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._stack.close()
 
-    def tearDown(self):
-        self.patcher.stop()
+    def setUp(self):
+        # Reuse the shared mock tree, dropping call history from earlier tests
+        self.mock_files.reset_mock()
+        self.mock_drives.reset_mock()
+        self.drive_service._access_cache.clear()
 
-    @patch('src.services.google.drive_service.build')
-    @patch('src.services.google.drive_service.service_account.Credentials')
-    def test_list_folders(self, mock_credentials, mock_build):
+    def test_list_folders(self):
         # Mock response data
         mock_folders = {
             'files': [
@@ -29,93 +82,45 @@ class TestGoogleDriveService(unittest.TestCase):
                 }
             ]
         }
+        self.mock_service.configure_mock(**{
+            'files.return_value.list.return_value.execute.return_value': mock_folders
+        })
 
-        # Setup mock service
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-        mock_files = MagicMock()
-        mock_service.files.return_value = mock_files
-        mock_list = MagicMock()
-        mock_files.list.return_value = mock_list
-        mock_list.execute.return_value = mock_folders
-
-        # Initialize service and test
-        drive_service = GoogleDriveService()
-        folders = drive_service.list_folders()
+        folders = self.drive_service.list_folders()
 
         # Verify results
         self.assertEqual(len(folders), 1)
         self.assertEqual(folders[0]['name'], 'Test Folder 1')
 
         # Verify correct query parameters for Team Drive
-        mock_files.list.assert_called_with(
+        self.mock_files.list.assert_called_with(
             q="'test_root_folder_id' in parents and mimeType='application/vnd.google-apps.folder' and trashed=false",
             supportsAllDrives=True,
             includeItemsFromAllDrives=True,
             corpora='drive',
             driveId='test_team_drive_id',
-            fields='files(id, name, createdTime, modifiedTime)',
-            orderBy='name'
+            orderBy='name',
+            pageSize=1000,
+            pageToken=None,
+            fields='nextPageToken, files(id, name, createdTime, modifiedTime)'
         )
 
-    @patch('src.services.google.drive_service.build')
-    @patch('src.services.google.drive_service.service_account.Credentials')
-    def test_verify_drive_access(self, mock_credentials, mock_build):
-        # Mock drive response
-        mock_drive_response = {
-            'id': 'test_team_drive_id',
-            'name': 'Test Team Drive',
-            'capabilities': {
-                'canAddChildren': True,
-                'canComment': True,
-                'canDownload': True,
-                'canManageTeamDrives': False
-            }
-        }
-        
-        # Mock folder response
-        mock_folder_response = {
-            'id': 'test_root_folder_id',
-            'name': 'Test Root Folder',
-            'capabilities': {
-                'canEdit': True,
-                'canShare': True,
-                'canComment': True,
-                'canReadRevisions': True
-            }
-        }
-        
-        # Setup mock service
-        mock_service = MagicMock()
-        mock_build.return_value = mock_service
-        
-        # Mock drives API
-        mock_drives = MagicMock()
-        mock_service.drives.return_value = mock_drives
-        mock_drives.get.return_value.execute.return_value = mock_drive_response
-        
-        # Mock files API
-        mock_files = MagicMock()
-        mock_service.files.return_value = mock_files
-        mock_files.get.return_value.execute.return_value = mock_folder_response
-        
-        # Initialize service and test
-        drive_service = GoogleDriveService()
-        success, access_info = drive_service.verify_drive_access()
-        
+    def test_verify_drive_access(self):
+        success, access_info = self.drive_service.verify_drive_access()
+
         # Verify results
         self.assertTrue(success)
         self.assertEqual(access_info['team_drive'], DriveAccessLevel.WRITER)
         self.assertEqual(access_info['root_folder'], DriveAccessLevel.ORGANIZER)
-        
+
         # Verify API calls
-        mock_drives.get.assert_called_with(
+        self.mock_drives.get.assert_called_with(
             driveId='test_team_drive_id',
             fields='id, name, capabilities'
         )
-        
-        mock_files.get.assert_called_with(
+
+        self.mock_files.get.assert_called_with(
             fileId='test_root_folder_id',
             supportsAllDrives=True,
-            fields='id, name, capabilities, permissions'
-        )
\ No newline at end of file
+            fields='id, name, capabilities, webViewLink'
+        )
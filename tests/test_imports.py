@@ -1,42 +1,59 @@
+"""Import smoke test.
+
+PYTEST_DONT_REWRITE: tiny module, plain asserts are enough.
+"""
+import importlib
+
 import pytest
 
-def test_all_imports():
-    """Test that all necessary imports work"""
+# Module -> names it must export; extend this table instead of writing import statements
+IMPORTS = {
     # Standard library imports
-    import os
-    import signal
-    import sys
+    "os": (),
+    "signal": (),
+    "sys": (),
 
     # Third-party imports
-    from dotenv import load_dotenv
-    import telebot
-    from telebot.handler_backends import State, StatesGroup
-    from telebot.storage import StateMemoryStorage
-    from telebot.types import BotCommand
+    "dotenv": ("load_dotenv",),
+    "telebot": (),
+    "telebot.handler_backends": ("State", "StatesGroup"),
+    "telebot.storage": ("StateMemoryStorage",),
+    "telebot.types": ("BotCommand",),
 
     # Local application imports
-    from src.commands import (
-        BOT_COMMANDS,
-        CMD_CAT,
-        CMD_DOG,
-        CMD_FUNNY,
-        CMD_GETLINK,
-        CMD_HELP,
-        CMD_LISTFOLDERS,
-        CMD_MEME,
-        CMD_MYID,
-        CMD_NEWEVENTFOLDER,
-        CMD_REGISTER,
-        CMD_SET_PHOTO,
-        CMD_SPACE,
-        CMD_START
-    )
-    from src.commands.basic_commands import register_basic_handlers
-    from src.commands.fun_commands import register_fun_handlers
-    from src.commands.google_drive_commands import register_google_drive_handlers
-    from src.commands.registration_commands import register_registration_handlers
-    from src.database.db import BotDB
-    from src.database.mongo_db import MongoDB
-    from src.middleware.auth import check_registration
+    "src.commands": (
+        "BOT_COMMANDS",
+        "CMD_CAT",
+        "CMD_DOG",
+        "CMD_FUNNY",
+        "CMD_GETLINK",
+        "CMD_HELP",
+        "CMD_LISTFOLDERS",
+        "CMD_MEME",
+        "CMD_MYID",
+        "CMD_NEWEVENTFOLDER",
+        "CMD_REGISTER",
+        "CMD_SET_PHOTO",
+        "CMD_SPACE",
+        "CMD_START",
+    ),
+    "src.commands.basic_commands": ("register_basic_handlers",),
+    "src.commands.fun_commands": ("register_fun_handlers",),
+    "src.commands.owner.drive_management": ("register_drive_handlers",),
+    "src.commands.registration_commands": ("register_registration_handlers",),
+    "src.database.mongo_db": ("MongoDB",),
+    "src.middleware.auth": ("check_registration",),
+}
 
-    assert True, "All imports successful" 
\ No newline at end of file
+@pytest.fixture(scope="session")
+def _all_imports():
+    """Import every entry-point module once per session; return any missing names"""
+    missing = []
+    for module_name, names in IMPORTS.items():
+        module = importlib.import_module(module_name)
+        missing.extend(f"{module_name}.{name}" for name in names if not hasattr(module, name))
+    return missing
+
+def test_all_imports(_all_imports):
+    """Test that all necessary imports work"""
+    assert not _all_imports, f"Missing names: {_all_imports}"
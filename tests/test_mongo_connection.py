@@ -1,5 +1,15 @@
+"""Live MongoDB connection check.
+
+PYTEST_DONT_REWRITE: tiny module, plain asserts are enough.
+"""
+import pytest
+
 from src.database.mongo_db import MongoDB
 
+pytestmark = pytest.mark.integration
+
+# Talks to a real MongoDB server
+@pytest.mark.serial
 def test_connection():
     try:
         db = MongoDB()